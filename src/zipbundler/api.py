@@ -173,6 +173,11 @@ def create_archive(  # noqa: PLR0912
     if filter is not None:
         logger.warning("filter parameter is not yet implemented, ignoring")
 
+    # Extract entry point code (may raise) before extracting an archive
+    entry_point_code: str | None = None
+    if main:
+        entry_point_code = extract_entry_point_code(main)
+
     # Check if source is an archive
     temp_dir: Path | None = None
     if is_archive_file(source_path):
@@ -189,11 +194,6 @@ def create_archive(  # noqa: PLR0912
         msg = f"Source must be a directory or .pyz archive file: {source_path}"
         raise ValueError(msg)
 
-    # Extract entry point code
-    entry_point_code: str | None = None
-    if main:
-        entry_point_code = extract_entry_point_code(main)
-
     # Convert interpreter to shebang
     if interpreter:
         shebang = interpreter if interpreter.startswith("#!") else f"#!{interpreter}"
@@ -303,8 +303,8 @@ def build_zip(  # noqa: C901, PLR0912, PLR0913, PLR0915
         options: dict[str, Any] | None = config.get("options")
         if options:
             # Shebang/interpreter
-            if interpreter is None and "shebang" in options:
-                shebang_val = options["shebang"]
+            if interpreter is None:
+                shebang_val = options.get("shebang")
                 if isinstance(shebang_val, str):
                     if shebang_val.startswith("#!"):
                         interpreter = shebang_val[2:]  # Remove #!
@@ -325,16 +325,15 @@ def build_zip(  # noqa: C901, PLR0912, PLR0913, PLR0915
                     compression = "stored"
 
             # Compression level
-            if compression_level is None and "compression_level" in options:
+            if compression_level is None:
                 compression_level_val = options.get("compression_level")
                 if isinstance(compression_level_val, int):
                     compression_level = compression_level_val
 
             # Main guard
-            if "main_guard" in options:
-                main_guard_val = options.get("main_guard")
-                if isinstance(main_guard_val, bool):
-                    main_guard = main_guard_val
+            main_guard_val = options.get("main_guard")
+            if isinstance(main_guard_val, bool):
+                main_guard = main_guard_val
     else:
         # No config, use defaults
         if not packages:
@@ -5,8 +5,10 @@ import io
 import stat
 import tempfile
 import zipfile
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import BinaryIO
 
 import pathspec as ps
 from apathetic_utils import is_excluded_raw
@@ -231,7 +233,7 @@ def build_zipapp(  # noqa: C901, PLR0912, PLR0913, PLR0915
     disable_build_timestamp: bool = False,
     input_archive: Path | str | None = None,
     preserve_input_files: bool = True,
-    source_bases: list[str] | None = None,
+    source_bases: Sequence[str] | None = None,
 ) -> None:
     """Build a zipapp-compatible zip file.
 
@@ -743,19 +745,31 @@ def get_interpreter(archive: Path | str) -> str | None:
         msg = f"Archive not found: {archive_path}"
         raise FileNotFoundError(msg)
 
-    # Read first 2 bytes to check for shebang
     with archive_path.open("rb") as f:
-        if f.read(2) != b"#!":
-            return None
+        return _read_interpreter(f)
 
-        # Read the rest of the shebang line
-        # Use 'utf-8' encoding with error handling, matching zipapp behavior
-        line = f.readline().strip()
-        try:
-            return line.decode("utf-8")
-        except UnicodeDecodeError:
-            # Fallback to latin-1 if utf-8 fails (matches zipapp behavior)
-            return line.decode("latin-1")
+
+def _read_interpreter(f: BinaryIO) -> str | None:
+    """Read the shebang interpreter from the start of an open archive.
+
+    Args:
+        f: Archive file opened in binary mode, positioned at the start
+
+    Returns:
+        The interpreter string (shebang line without #!), or None
+    """
+    # Read first 2 bytes to check for shebang
+    if f.read(2) != b"#!":
+        return None
+
+    # Read the rest of the shebang line
+    # Use 'utf-8' encoding with error handling, matching zipapp behavior
+    line = f.readline().strip()
+    try:
+        return line.decode("utf-8")
+    except UnicodeDecodeError:
+        # Fallback to latin-1 if utf-8 fails (matches zipapp behavior)
+        return line.decode("latin-1")
 
 
 def list_files_from_archive(
@@ -847,55 +861,77 @@ def get_metadata_from_archive(archive: Path | str) -> dict[str, str] | None:
         ValueError: If the archive is not a valid zipapp file
         zipfile.BadZipFile: If the archive is corrupted
     """
+    return get_archive_info(archive)[1]
+
+
+def get_archive_info(
+    archive: Path | str,
+) -> tuple[str | None, dict[str, str] | None]:
+    """Get the interpreter and PKG-INFO metadata with a single open.
+
+    zipfile locates the central directory from the end of the file, so the
+    shebang prefix needs no skipping and the archive is never copied into
+    memory.
+
+    Args:
+        archive: Path to the zipapp archive (.pyz file)
+
+    Returns:
+        (interpreter, metadata) as returned by get_interpreter() and
+        get_metadata_from_archive()
+
+    Raises:
+        FileNotFoundError: If the archive file does not exist
+        ValueError: If the archive is not a valid zip file
+    """
     archive_path = Path(archive)
     if not archive_path.exists():
         msg = f"Archive not found: {archive_path}"
         raise FileNotFoundError(msg)
 
-    # Read the archive, skipping shebang if present
     with archive_path.open("rb") as f:
-        # Check for shebang (first 2 bytes are #!)
-        first_two = f.read(2)
-        if first_two == b"#!":
-            # Skip shebang line
-            f.readline()
-        else:
-            # No shebang, rewind to start
-            f.seek(0)
+        interpreter = _read_interpreter(f)
+        try:
+            with zipfile.ZipFile(f, "r") as zf:
+                metadata = _read_pkg_info(zf)
+        except zipfile.BadZipFile as e:
+            msg = f"Invalid zip file in archive: {archive_path}"
+            raise ValueError(msg) from e
+    return interpreter, metadata
 
-        # Read remaining data (the zip file)
-        zip_data = f.read()
 
-    # Open zip file from memory
+def _read_pkg_info(zf: zipfile.ZipFile) -> dict[str, str] | None:
+    """Parse PKG-INFO from an open archive into our metadata format.
+
+    Args:
+        zf: Open archive
+
+    Returns:
+        Metadata dict, or None if PKG-INFO is missing or has no known fields
+    """
     try:
-        with zipfile.ZipFile(io.BytesIO(zip_data), "r") as zf:
-            if "PKG-INFO" not in zf.namelist():
-                return None
-
-            # Read PKG-INFO content
-            pkg_info_bytes = zf.read("PKG-INFO")
-            pkg_info_text = pkg_info_bytes.decode("utf-8")
-
-            # Parse PKG-INFO format (key: value lines)
-            metadata: dict[str, str] = {}
-            for line in pkg_info_text.splitlines():
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    # Map PKG-INFO fields to our metadata format
-                    if key == "Name":
-                        metadata["display_name"] = value
-                    elif key == "Version":
-                        metadata["version"] = value
-                    elif key == "Summary":
-                        metadata["description"] = value
-                    elif key == "Author":
-                        metadata["author"] = value
-                    elif key == "License":
-                        metadata["license"] = value
-
-            return metadata if metadata else None
-    except zipfile.BadZipFile as e:
-        msg = f"Invalid zip file in archive: {archive_path}"
-        raise ValueError(msg) from e
+        pkg_info_bytes = zf.read("PKG-INFO")
+    except KeyError:
+        return None
+    pkg_info_text = pkg_info_bytes.decode("utf-8")
+
+    # Parse PKG-INFO format (key: value lines)
+    metadata: dict[str, str] = {}
+    for line in pkg_info_text.splitlines():
+        if ":" in line:
+            key, value = line.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+            # Map PKG-INFO fields to our metadata format
+            if key == "Name":
+                metadata["display_name"] = value
+            elif key == "Version":
+                metadata["version"] = value
+            elif key == "Summary":
+                metadata["description"] = value
+            elif key == "Author":
+                metadata["author"] = value
+            elif key == "License":
+                metadata["license"] = value
+
+    return metadata if metadata else None
@@ -552,8 +552,8 @@ def _prepare_init_args(parsed_args: argparse.Namespace) -> argparse.Namespace:
     """Prepare arguments for init command."""
     init_args = argparse.Namespace()
     # Use --config to specify where to create the config file
-    init_args.config = getattr(parsed_args, "config", None)
-    init_args.force = getattr(parsed_args, "force", False)
+    init_args.config = parsed_args.config
+    init_args.force = parsed_args.force
     init_args.log_level = parsed_args.log_level
     return init_args
 
@@ -564,35 +564,27 @@ def _prepare_build_args(parsed_args: argparse.Namespace) -> argparse.Namespace:
     build_args.config = parsed_args.config
     build_args.output = parsed_args.output
     build_args.input = parsed_args.input
-    build_args.input_mode = getattr(parsed_args, "input_mode", "append")
+    build_args.input_mode = parsed_args.input_mode
     build_args.entry_point = parsed_args.entry_point
-    build_args.main_mode = getattr(parsed_args, "main_mode", None)
-    build_args.main_name = getattr(parsed_args, "main_name", None)
+    build_args.main_mode = parsed_args.main_mode
+    build_args.main_name = parsed_args.main_name
     build_args.shebang = parsed_args.shebang
     # Handle --compress, --no-compress, and compression_level
-    if hasattr(parsed_args, "compress") and parsed_args.compress is False:
-        # --no-compress was explicitly set
-        build_args.compress = False
-    elif hasattr(parsed_args, "compress") and parsed_args.compress is True:
-        # --compress was set
-        build_args.compress = True
-    else:
-        # Neither flag was set, let config file decide
-        build_args.compress = None
-    build_args.compression_level = getattr(parsed_args, "compress_level", None)
-    build_args.include = getattr(parsed_args, "include", None)
-    build_args.add_include = getattr(parsed_args, "add_include", None)
-    build_args.add_zip = getattr(parsed_args, "add_zip", None)
-    build_args.exclude = getattr(parsed_args, "exclude", None)
-    build_args.add_exclude = getattr(parsed_args, "add_exclude", None)
-    build_args.respect_gitignore = getattr(parsed_args, "respect_gitignore", None)
+    # (True for --compress, False for --no-compress, None lets config decide)
+    compress: object = parsed_args.compress
+    build_args.compress = compress if isinstance(compress, bool) else None
+    build_args.compression_level = parsed_args.compress_level
+    build_args.include = parsed_args.include
+    build_args.add_include = parsed_args.add_include
+    build_args.add_zip = parsed_args.add_zip
+    build_args.exclude = parsed_args.exclude
+    build_args.add_exclude = parsed_args.add_exclude
+    build_args.respect_gitignore = parsed_args.respect_gitignore
     # main_guard removed (handled via config)
-    build_args.disable_build_timestamp = getattr(
-        parsed_args, "disable_build_timestamp", None
-    )
-    build_args.dry_run = getattr(parsed_args, "dry_run", False)
-    build_args.force = getattr(parsed_args, "force", False)
-    build_args.strict = getattr(parsed_args, "strict", False)
+    build_args.disable_build_timestamp = parsed_args.disable_build_timestamp
+    build_args.dry_run = parsed_args.dry_run
+    build_args.force = parsed_args.force
+    build_args.strict = parsed_args.strict
     build_args.log_level = parsed_args.log_level
     return build_args
 
@@ -609,8 +601,8 @@ def _prepare_list_args(parsed_args: argparse.Namespace) -> argparse.Namespace:
 def _prepare_validate_args(parsed_args: argparse.Namespace) -> argparse.Namespace:
     """Prepare arguments for validate command."""
     validate_args = argparse.Namespace()
-    validate_args.config = getattr(parsed_args, "config", None)
-    validate_args.strict = getattr(parsed_args, "strict", False)
+    validate_args.config = parsed_args.config
+    validate_args.strict = parsed_args.strict
     validate_args.log_level = parsed_args.log_level
     return validate_args
 
@@ -622,16 +614,14 @@ def _prepare_watch_args(parsed_args: argparse.Namespace) -> argparse.Namespace:
     watch_args.include = parsed_args.include if parsed_args.include else []
     watch_args.output = parsed_args.output
     watch_args.entry_point = parsed_args.entry_point
-    watch_args.main_mode = getattr(parsed_args, "main_mode", None)
-    watch_args.main_name = getattr(parsed_args, "main_name", None)
+    watch_args.main_mode = parsed_args.main_mode
+    watch_args.main_name = parsed_args.main_name
     watch_args.shebang = parsed_args.shebang
     watch_args.compress = parsed_args.compress
-    watch_args.exclude = getattr(parsed_args, "exclude", None)
-    watch_args.add_exclude = getattr(parsed_args, "add_exclude", None)
-    watch_args.respect_gitignore = getattr(parsed_args, "respect_gitignore", None)
-    watch_args.disable_build_timestamp = getattr(
-        parsed_args, "disable_build_timestamp", None
-    )
+    watch_args.exclude = parsed_args.exclude
+    watch_args.add_exclude = parsed_args.add_exclude
+    watch_args.respect_gitignore = parsed_args.respect_gitignore
+    watch_args.disable_build_timestamp = parsed_args.disable_build_timestamp
     watch_args.watch = parsed_args.watch  # Can be float or None
     # main_guard removed (handled via config)
     watch_args.log_level = parsed_args.log_level
@@ -650,7 +640,7 @@ def main(args: list[str] | None = None) -> int:  # noqa: PLR0911, PLR0912, C901
     logger.setLevel(resolved_log_level)
 
     # Initialize color output based on CLI args
-    use_color = getattr(parsed_args, "use_color", None)
+    use_color = parsed_args.use_color
     if use_color is not None:
         logger.enable_color = use_color
     else:
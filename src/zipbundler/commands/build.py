@@ -3,12 +3,17 @@
 """Handle the build subcommand."""
 
 import argparse
+import fnmatch
+import functools
+import importlib.machinery
 import importlib.util
+import itertools
 import os
-from importlib.metadata import distributions as _distributions
+import re
+import stat
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-
-from apathetic_utils import cast_hint, has_glob_chars
+from typing import Literal, cast
 
 from zipbundler.build import build_zipapp
 from zipbundler.commands.init import extract_metadata_from_pyproject
@@ -18,6 +23,7 @@ from zipbundler.config import (
     OptionsConfig,
     OutputConfig,
     load_and_validate_config,
+    split_entry_point,
 )
 from zipbundler.constants import (
     DEFAULT_DISABLE_BUILD_TIMESTAMP,
@@ -26,7 +32,8 @@ from zipbundler.constants import (
 )
 from zipbundler.logs import getAppLogger
 from zipbundler.utils import (
-    load_gitignore_patterns,
+    iter_gitignore_patterns,
+    make_exclude_resolved,
     resolve_compress,
     resolve_excludes,
     resolve_gitignore,
@@ -34,11 +41,256 @@ from zipbundler.utils import (
 )
 
 
+# Recursive "all Python files" glob suffixes; the part before is the package root
+_PY_GLOB_SUFFIXES = ("/**/*.py", "\\**\\*.py")
+
+# Glob metacharacters (same set as apathetic_utils.has_glob_chars)
+_GLOB_CHAR_RE = re.compile(r"[*?\[\]]")
+
+
+# Directory entries _prime_stat_cache reads per requested name; past this
+# the requested names are too small a share of the listing to beat a stat each
+_PRIME_ENTRIES_PER_NAME = 4
+
+# Environment variable values treated as true
+_TRUTHY_ENV = frozenset({"true", "1", "yes", "on"})
+
+# Result of _stat_kind
+StatKind = Literal["dir", "file", "missing"]
+
+# Result of _classify_pattern
+PatternKind = Literal["py_recursive", "glob", "path", "name"]
+
+
+def _join_normalized(base: Path, relative: str) -> Path:
+    """Join a relative pattern onto base and normalize it lexically.
+
+    Unlike Path.resolve(), this does no realpath syscalls, so symlinks and
+    ".." across them are left as written. Use it only where a lexical path is
+    enough; anything deduplicated or archived must be canonicalized with
+    os.path.realpath first (see `_iter_resolved_packages`).
+
+    Args:
+        base: Already-resolved base directory
+        relative: Relative (or absolute) path string
+
+    Returns:
+        Normalized absolute Path
+    """
+    return Path(os.path.normpath(os.path.join(base, relative)))  # noqa: PTH118
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_find_spec(name: str) -> importlib.machinery.ModuleSpec | None:
+    """Memoized importlib.util.find_spec, so sys.meta_path is walked once per name.
+
+    Args:
+        name: Top-level module or package name
+
+    Returns:
+        The module spec, or None if the name is not importable
+    """
+    return importlib.util.find_spec(name)
+
+
+def invalidate_package_cache() -> None:
+    """Forget cached installed-package lookups.
+
+    Call after installing or removing packages in a running process so the
+    next build sees the current environment.
+    """
+    _cached_find_spec.cache_clear()
+    _locate_installed_package.cache_clear()
+    _build_dist_index.cache_clear()
+    importlib.invalidate_caches()
+
+
+def _normalize_dist_name(name: str) -> str:
+    """Normalize a distribution or package name for index lookups.
+
+    Args:
+        name: Distribution or package name
+
+    Returns:
+        Lowercased name with "-" replaced by "_"
+    """
+    return name.lower().replace("-", "_")
+
+
+def _stat_kind(
+    path: str | os.PathLike[str],
+    stat_cache: dict[str, StatKind] | None = None,
+) -> StatKind:
+    """Classify a path with a single stat call.
+
+    Replaces exists() followed by is_dir()/is_file(), which stats twice.
+
+    Args:
+        path: Path to check (symlinks are followed)
+        stat_cache: Optional per-build cache; paths already classified in it
+            are not stat'ed again
+
+    Returns:
+        "dir" for directories, "file" for anything else that exists,
+        "missing" if the path cannot be stat'ed
+    """
+    key = os.fspath(path)
+    if stat_cache is not None:
+        cached = stat_cache.get(key)
+        if cached is not None:
+            return cached
+    try:
+        mode = os.stat(key).st_mode  # noqa: PTH116
+    except (OSError, ValueError):
+        # ValueError: the path contains a NUL byte
+        kind: StatKind = "missing"
+    else:
+        kind = "dir" if stat.S_ISDIR(mode) else "file"
+    if stat_cache is not None:
+        stat_cache[key] = kind
+    return kind
+
+
+@functools.cache
+def _build_dist_index() -> dict[str, tuple[str, Path]]:
+    """Index installed distributions by normalized name.
+
+    Walking importlib.metadata.distributions() reads every installed package's
+    METADATA from disk, so the walk is done once per process and later lookups
+    are a dict hit. Call `invalidate_package_cache()` to pick up packages
+    installed after the first lookup.
+
+    Returns:
+        Mapping of normalized name (lowercase, "-" -> "_") to
+        (dist_name, distribution_root). The first distribution found for a
+        name wins, matching sys.path order.
+    """
+    # Deferred: importlib.metadata is only needed when find_spec misses
+    from importlib.metadata import distributions  # noqa: PLC0415
+
+    logger = getAppLogger()
+    index: dict[str, tuple[str, Path]] = {}
+
+    for dist in distributions():
+        dist_name = dist.name or ""
+        if not dist_name:
+            continue
+        normalized_dist = _normalize_dist_name(dist_name)
+        if normalized_dist in index:
+            continue
+        try:
+            # Get the root of the distribution
+            dist_path = Path(str(dist.locate_file("")))
+        except (OSError, NotImplementedError) as e:
+            logger.trace("Error locating distribution '%s': %s", dist_name, e)
+            continue
+        index[normalized_dist] = (dist_name, dist_path)
+
+    return index
+
+
+def _find_distribution(package_name: str) -> tuple[str, Path] | None:
+    """Find the distribution providing a package name.
+
+    Asks importlib.metadata for the distribution directly (trying the name
+    as given and with "-"/"_" swapped) so a hit reads a single METADATA file.
+    Only when neither form is a distribution name does it fall back to the
+    full index from `_build_dist_index`.
+
+    Args:
+        package_name: Package or distribution name
+
+    Returns:
+        (dist_name, distribution_root) if found, None otherwise
+    """
+    from importlib.metadata import PackageNotFoundError, distribution  # noqa: PLC0415
+
+    candidates = dict.fromkeys(
+        (
+            package_name,
+            package_name.replace("-", "_"),
+            package_name.replace("_", "-"),
+        )
+    )
+    for candidate in candidates:
+        try:
+            dist = distribution(candidate)
+            dist_path = Path(str(dist.locate_file("")))
+        except (PackageNotFoundError, OSError, NotImplementedError):
+            continue
+        return dist.name or candidate, dist_path
+
+    return _build_dist_index().get(_normalize_dist_name(package_name))
+
+
+@functools.cache
+def _locate_installed_package(package_name: str) -> tuple[Path, bool] | None:
+    """Locate an installed package without logging (cached core).
+
+    Installed packages do not move during a run, so the find_spec and
+    distribution lookups are memoized per package name.
+
+    Args:
+        package_name: Name of the installed package (e.g., "apathetic_utils")
+
+    Returns:
+        (path, is_distribution_root) if found, None otherwise
+    """
+    # Try importlib.util.find_spec (most reliable method). Only the top-level
+    # name is looked up: find_spec("pkg.sub") would import (and run) pkg to
+    # find its __path__, so subpackages are located by walking directories.
+    top_name, _, sub_path = package_name.partition(".")
+    try:
+        spec = _cached_find_spec(top_name)
+    except (ImportError, ValueError):
+        # Empty/relative names or modules with a broken __spec__
+        spec = None
+    if spec is not None and spec.origin is not None:
+        origin_path = Path(spec.origin)
+        origin_kind = _stat_kind(origin_path)
+        # If origin is a file (e.g., __init__.py), use its parent directory,
+        # which is known to exist without another stat
+        package_path = origin_path.parent if origin_kind == "file" else origin_path
+        found = origin_kind != "missing"
+        if found and sub_path:
+            package_path = package_path.joinpath(*sub_path.split("."))
+            found = _stat_kind(package_path) == "dir"
+        if found:
+            return package_path, False
+
+    # Fallback: try importlib.metadata for distribution-based lookup
+    entry = _find_distribution(package_name)
+    if entry is None:
+        return None
+
+    dist_name, dist_path = entry
+    # Look for the package directory within the distribution
+    # The package name might be different from the distribution name
+    # (names usually coincide, so duplicates are dropped before stat'ing)
+    possible_names = dict.fromkeys(
+        (
+            package_name,
+            package_name.replace("-", "_"),
+            dist_name.replace("-", "_"),
+        )
+    )
+    for name in possible_names:
+        possible_path = dist_path / name
+        if possible_path.is_dir():
+            return possible_path, False
+    # If no exact match, return the distribution root
+    if dist_path.exists():
+        return dist_path, True
+    return None
+
+
 def _resolve_installed_package(package_name: str) -> Path | None:
     """Resolve an installed package by name to its location.
 
     Uses importlib.util.find_spec to find the package location. If the package
-    is found, returns the Path to the package directory.
+    is found, returns the Path to the package directory. Otherwise falls back
+    to the cached index of installed distributions. Lookups are memoized by
+    `_locate_installed_package`; logging happens here on every call.
 
     Args:
         package_name: Name of the installed package (e.g., "apathetic_utils")
@@ -47,73 +299,220 @@ def _resolve_installed_package(package_name: str) -> Path | None:
         Path to the package directory if found, None otherwise
     """
     logger = getAppLogger()
+    found = _locate_installed_package(package_name)
+    if found is None:
+        logger.trace("Installed package '%s' not found", package_name)
+        return None
 
-    # Try importlib.util.find_spec (most reliable method)
-    try:
-        spec = importlib.util.find_spec(package_name)
-        if spec is not None and spec.origin is not None:
-            origin_path = Path(spec.origin)
-            # If origin is a file (e.g., __init__.py), use its parent directory
-            package_path = origin_path.parent if origin_path.is_file() else origin_path
-            if package_path.exists() and package_path.is_dir():
-                logger.debug(
-                    "Resolved installed package '%s' to: %s",
-                    package_name,
-                    package_path,
-                )
-                return package_path
-    except Exception as e:  # noqa: BLE001
-        logger.trace(
-            "Error finding package '%s' via importlib.util: %s", package_name, e
+    package_path, is_dist_root = found
+    if is_dist_root:
+        logger.debug(
+            "Resolved installed package '%s' to distribution root: %s",
+            package_name,
+            package_path,
         )
+    else:
+        logger.debug(
+            "Resolved installed package '%s' to: %s", package_name, package_path
+        )
+    return package_path
 
-    # Fallback: try importlib.metadata for distribution-based lookup
+
+def _prime_stat_cache(paths: Iterable[str], stat_cache: dict[str, StatKind]) -> None:
+    """Classify sibling paths from one directory listing per parent.
+
+    Paths are grouped by parent directory. Parents with at least two
+    uncached children are listed with os.scandir, and each requested
+    child's kind is taken from its DirEntry. The listing stops after
+    `_PRIME_ENTRIES_PER_NAME` entries per requested name, so a few includes
+    in a large directory don't pay for reading all of it. Lone paths, glob
+    patterns, symlinks and names not reached in the listing (which may also
+    differ only in case on case-insensitive filesystems) are left for
+    `_stat_kind` to stat.
+
+    Args:
+        paths: Absolute, normalized candidate paths
+        stat_cache: Cache to fill (see `_stat_kind`)
+    """
+    by_parent: dict[str, set[str]] = {}
+    for path in paths:
+        if path in stat_cache or _GLOB_CHAR_RE.search(path):
+            continue
+        parent, name = os.path.split(path)
+        by_parent.setdefault(parent, set()).add(name)
+
+    for parent, names in by_parent.items():
+        if len(names) < 2:  # noqa: PLR2004
+            continue
+        budget = len(names) * _PRIME_ENTRIES_PER_NAME
+        try:
+            with os.scandir(parent) as it:
+                entries = [
+                    entry
+                    for entry in itertools.islice(it, budget)
+                    if entry.name in names
+                ]
+        except OSError:
+            continue
+        for entry in entries:
+            if not entry.is_symlink():
+                stat_cache[entry.path] = "dir" if entry.is_dir() else "file"
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(segment: str) -> re.Pattern[str]:
+    """Compile a single glob path segment to a regex, once per segment.
+
+    Segments are compiled separately because fnmatch's "*" would otherwise
+    match across "/".
+
+    Args:
+        segment: One path segment of a glob pattern (no separators)
+
+    Returns:
+        Compiled pattern matching whole entry names
+    """
+    return re.compile(fnmatch.translate(segment))
+
+
+def _scan_sorted(path: str) -> list[os.DirEntry[str]]:
+    """List a directory's entries sorted by name, or [] if it can't be read."""
     try:
-        # Check all distributions for a matching package
-        for dist in _distributions():
-            # Check if the distribution name matches (normalize names)
-            dist_name = getattr(dist.metadata, "Name", "") or ""
-            normalized_dist = dist_name.lower().replace("-", "_")
-            normalized_pkg = package_name.lower().replace("-", "_")
-            if dist_name and normalized_dist == normalized_pkg:
-                try:
-                    # Get the root of the distribution
-                    dist_file_path = dist.locate_file("")
-                    dist_path = Path(str(dist_file_path))
-                    # Look for the package directory within the distribution
-                    # The package name might be different from the distribution name
-                    possible_paths = [
-                        dist_path / package_name,
-                        dist_path / package_name.replace("-", "_"),
-                        dist_path / dist_name.replace("-", "_"),
-                    ]
-                    for possible_path in possible_paths:
-                        if possible_path.exists() and possible_path.is_dir():
-                            logger.debug(
-                                "Resolved installed package '%s' to: %s",
-                                package_name,
-                                possible_path,
-                            )
-                            return possible_path
-                    # If no exact match, return the distribution root
-                    if dist_path.exists():
-                        logger.debug(
-                            "Resolved installed package '%s' to distribution root: %s",
-                            package_name,
-                            dist_path,
-                        )
-                        return Path(dist_path)
-                except Exception as e:  # noqa: BLE001
-                    logger.trace("Error locating package '%s': %s", package_name, e)
-    except Exception as e:  # noqa: BLE001
-        logger.trace(
-            "Error finding package '%s' via importlib.metadata: %s", package_name, e
-        )
+        with os.scandir(path) as it:
+            return sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return []
+
+
+def _scandir_glob(  # noqa: PLR0912
+    root: str,
+    pattern: str,
+    stat_cache: dict[str, StatKind] | None = None,
+) -> Iterator[tuple[str, bool]]:
+    """Match a glob pattern below root using os.scandir.
+
+    Supports "*", "?", "[...]" within a path segment and "**" for any
+    number of directories. As with shell globs, wildcards skip dot-prefixed
+    names unless the segment itself starts with ".". Literal segments are
+    joined without listing the directory, and entry types come from the
+    directory listing, so only a final literal segment needs a stat. "**"
+    follows symlinked directories like pathlib's glob, but walks each real
+    directory once per "**" segment, keyed by (st_dev, st_ino), so symlink
+    loops terminate.
 
-    return None
+    Args:
+        root: Directory the pattern is relative to
+        pattern: Glob pattern, "/" or backslash separated
+        stat_cache: Optional per-build cache passed to `_stat_kind`
 
+    Yields:
+        (path, is_dir) for each match, in sorted walk order
+    """
+    segments = [
+        segment
+        for segment in pattern.replace("\\", "/").split("/")
+        if segment and segment != "."
+    ]
+    matchers = {
+        index: _compile_glob(segment).match
+        for index, segment in enumerate(segments)
+        if segment != "**" and _GLOB_CHAR_RE.search(segment)
+    }
+    last = len(segments)
+    # Directories already expanded for a "**" segment: (st_dev, st_ino, index)
+    visited: set[tuple[int, int, int]] = set()
+    # Stack of (path, next segment index, is_dir); pushed in reverse so
+    # entries are visited in sorted order
+    stack: list[tuple[str, int, bool]] = [(root, 0, True)]
+    while stack:
+        path, index, is_dir = stack.pop()
+        if index == last:
+            yield path, is_dir
+            continue
+        if not is_dir:
+            continue
+
+        segment = segments[index]
+        if segment == "**":
+            try:
+                st = os.stat(path)  # noqa: PTH116
+            except OSError:
+                continue
+            key = (st.st_dev, st.st_ino, index)
+            if key in visited:
+                continue
+            visited.add(key)
+            children: list[tuple[str, int, bool]] = []
+            for entry in _scan_sorted(path):
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    children.append((entry.path, index, True))
+                elif index + 1 == last:
+                    # A trailing "**" also matches files
+                    children.append((entry.path, last, False))
+            stack.extend(reversed(children))
+            # Zero directories: continue with the next segment here first
+            stack.append((path, index + 1, True))
+        elif index not in matchers:
+            child = os.path.join(path, segment)  # noqa: PTH118
+            if index + 1 < last:
+                # Scanned at the next level; a missing dir just yields nothing
+                stack.append((child, index + 1, True))
+            else:
+                kind = _stat_kind(child, stat_cache)
+                if kind != "missing":
+                    stack.append((child, index + 1, kind == "dir"))
+        else:
+            match = matchers[index]
+            show_hidden = segment.startswith(".")
+            children = [
+                (entry.path, index + 1, entry.is_dir())
+                for entry in _scan_sorted(path)
+                if (show_hidden or not entry.name.startswith(".")) and match(entry.name)
+            ]
+            stack.extend(reversed(children))
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_pattern(pattern: str) -> tuple[PatternKind, str]:
+    """Classify a package pattern and extract its literal base in one pass.
+
+    Args:
+        pattern: Package pattern from config or CLI
 
-def _resolve_package_pattern(pattern: str, cwd: Path) -> list[Path]:  # noqa: C901, PLR0912, PLR0915
+    Returns:
+        (kind, base) where kind is one of:
+        - "py_recursive": ends with /**/*.py; base is the directory before it
+        - "glob": other glob; base is the directory part of the literal
+          prefix before the first glob character ("" for cwd)
+        - "path": a relative or absolute path; base is the pattern
+        - "name": a bare name (local dir or installed package); base is the
+          pattern
+    """
+    for suffix in _PY_GLOB_SUFFIXES:
+        if pattern.endswith(suffix):
+            return "py_recursive", pattern[: -len(suffix)]
+
+    glob_char = _GLOB_CHAR_RE.search(pattern)
+    if glob_char is not None:
+        prefix = pattern[: glob_char.start()]
+        sep_index = max(prefix.rfind("/"), prefix.rfind("\\"))
+        # Keep a lone leading separator so absolute roots stay absolute
+        root = prefix[:sep_index] if sep_index > 0 else prefix[: sep_index + 1]
+        return "glob", root
+
+    if "/" in pattern or "\\" in pattern or pattern.startswith("."):
+        return "path", pattern
+    return "name", pattern
+
+
+def _resolve_package_pattern(  # noqa: PLR0912, PLR0915
+    pattern: str,
+    cwd: Path,
+    *,
+    stat_cache: dict[str, StatKind] | None = None,
+) -> list[Path]:
     """Resolve a package pattern to actual package paths.
 
     Handles:
@@ -124,6 +523,8 @@ def _resolve_package_pattern(pattern: str, cwd: Path) -> list[Path]:  # noqa: C9
     Args:
         pattern: Package pattern (path, glob, or installed package name)
         cwd: Current working directory for resolving relative paths
+        stat_cache: Optional cache shared by the patterns of one build, so
+            common roots and directories are stat'ed once
 
     Returns:
         List of resolved package Path objects
@@ -131,13 +532,13 @@ def _resolve_package_pattern(pattern: str, cwd: Path) -> list[Path]:  # noqa: C9
     logger = getAppLogger()
     resolved: list[Path] = []
 
+    kind, base_str = _classify_pattern(pattern)
+
     # Handle glob patterns ending with /**/*.py - extract base directory
     # This is the most common pattern in configs
-    if pattern.endswith(("/**/*.py", "\\**\\*.py")):
-        # Extract base directory before /**/*.py
-        base_str = pattern.rsplit("/**/*.py", 1)[0].rsplit("\\**\\*.py", 1)[0]
-        base_path = (cwd / base_str).resolve()
-        if base_path.exists() and base_path.is_dir():
+    if kind == "py_recursive":
+        base_path = _join_normalized(cwd, base_str)
+        if _stat_kind(base_path, stat_cache) == "dir":
             resolved.append(base_path)
             logger.trace("Resolved pattern '%s' to package: %s", pattern, base_path)
         else:
@@ -148,57 +549,47 @@ def _resolve_package_pattern(pattern: str, cwd: Path) -> list[Path]:  # noqa: C9
             )
         return resolved
 
-    # Check if pattern has glob characters (other than /**/*.py)
-    if has_glob_chars(pattern):
-        # For other glob patterns, try to find the base directory
-        # Split on first glob char to find root
-        if "*" in pattern:
-            # Find the root of the glob pattern
-            parts = pattern.split("*", 1)
-            if parts[0]:
-                glob_root_str = parts[0].rstrip("/\\")
-                glob_root = (cwd / glob_root_str).resolve() if glob_root_str else cwd
-            else:
-                glob_root = cwd
-
-            if glob_root.exists():
-                # Use pathlib glob to find matching paths
-                try:
-                    matches = list(glob_root.glob(pattern))
-                    # Collect unique parent directories of Python files,
-                    # or directories themselves
-                    seen: set[Path] = set()
-                    for match in matches:
-                        if match.is_dir():
-                            resolved_path = match.resolve()
-                            if resolved_path not in seen:
-                                seen.add(resolved_path)
-                                resolved.append(resolved_path)
-                        elif match.is_file() and match.suffix == ".py":
-                            # If it's a Python file, use its parent directory
-                            parent = match.parent.resolve()
-                            if parent not in seen:
-                                seen.add(parent)
-                                resolved.append(parent)
-                except Exception as e:  # noqa: BLE001
-                    logger.warning("Error globbing pattern '%s': %s", pattern, e)
-            else:
-                logger.warning(
-                    "Glob root does not exist for pattern '%s': %s", pattern, glob_root
-                )
-    else:
-        # Simple path - resolve relative to cwd
-        full_path = (cwd / pattern).resolve()
-        if full_path.exists():
-            if full_path.is_dir():
-                resolved.append(full_path)
-            else:
-                logger.warning("Pattern '%s' is a file, not a directory", pattern)
-        # Path doesn't exist - try resolving as installed package name
-        # Only try if pattern doesn't look like a path
-        # (no slashes, no dots as path separators)
-        elif "/" not in pattern and "\\" not in pattern and not pattern.startswith("."):
-            # Try to resolve as installed package
+    if kind == "glob":
+        glob_root_str = base_str
+        glob_root = _join_normalized(cwd, glob_root_str) if glob_root_str else cwd
+        if _stat_kind(glob_root, stat_cache) != "missing":
+            # Walk from the glob root with os.scandir: directory entries
+            # already carry their type, so matches need no extra stat
+            glob_rest = pattern[len(glob_root_str) :]
+            try:
+                # Collect unique parent directories of Python files,
+                # or directories themselves
+                seen_dirs: dict[str, None] = {}
+                for match, match_is_dir in _scandir_glob(
+                    str(glob_root), glob_rest, stat_cache
+                ):
+                    if match_is_dir:
+                        seen_dirs[match] = None
+                    elif match.endswith(".py"):
+                        # If it's a Python file, use its parent directory
+                        seen_dirs[os.path.dirname(match)] = None  # noqa: PTH120
+                # The walker follows symlinked dirs, so one directory can
+                # match under several names; dedupe on the real path
+                real_dirs = dict.fromkeys(map(os.path.realpath, seen_dirs))
+                resolved.extend(map(Path, real_dirs))
+            except (OSError, ValueError) as e:
+                logger.warning("Error globbing pattern '%s': %s", pattern, e)
+        else:
+            logger.warning(
+                "Glob root does not exist for pattern '%s': %s", pattern, glob_root
+            )
+    elif kind == "name":
+        # Bare name: a local directory wins, otherwise an installed package.
+        # A single stat answers both "exists" and "is dir" before any
+        # resolve() or find_spec work.
+        local_path = os.path.join(cwd, pattern)  # noqa: PTH118
+        local_kind = _stat_kind(local_path, stat_cache)
+        if local_kind == "dir":
+            resolved.append(Path(os.path.normpath(local_path)))
+        elif local_kind == "file":
+            logger.warning("Pattern '%s' is a file, not a directory", pattern)
+        else:
+            # Path doesn't exist - try resolving as installed package name
             installed_path = _resolve_installed_package(pattern)
             if installed_path is not None:
                 resolved.append(installed_path)
@@ -212,8 +603,16 @@ def _resolve_package_pattern(pattern: str, cwd: Path) -> list[Path]:  # noqa: C9
                     "Pattern '%s' resolved to non-existent path and is not an "
                     "installed package: %s",
                     pattern,
-                    full_path,
+                    Path(os.path.normpath(local_path)),
                 )
+    else:
+        # Simple path - resolve relative to cwd
+        full_path = _join_normalized(cwd, pattern)
+        full_kind = _stat_kind(full_path, stat_cache)
+        if full_kind == "dir":
+            resolved.append(full_path)
+        elif full_kind == "file":
+            logger.warning("Pattern '%s' is a file, not a directory", pattern)
         else:
             logger.warning(
                 "Pattern '%s' resolved to non-existent path: %s",
@@ -224,53 +623,105 @@ def _resolve_package_pattern(pattern: str, cwd: Path) -> list[Path]:  # noqa: C9
     return resolved
 
 
-def _resolve_packages(packages: list[str], cwd: Path) -> list[Path]:
-    """Resolve multiple package patterns to actual package paths.
+def _iter_resolved_packages(
+    packages: list[str],
+    cwd: Path,
+    stat_cache: dict[str, StatKind] | None = None,
+) -> Iterator[Path]:
+    """Yield unique package paths as each pattern is resolved.
 
     Args:
         packages: List of package patterns
         cwd: Current working directory
+        stat_cache: Path-kind cache shared by all patterns (a fresh one is
+            created when omitted)
 
-    Returns:
-        List of unique resolved package Path objects
+    Yields:
+        Unique package paths, canonicalized with os.path.realpath so that
+        symlink aliases of one directory are yielded once, in pattern order
     """
     logger = getAppLogger()
-    all_packages: list[Path] = []
+    seen: set[str] = set()
+
+    # Duplicate patterns resolve identically within one build, so each unique
+    # pattern is resolved once. Results are not cached across calls because
+    # the filesystem may change between builds (watch mode, API callers).
+    unique_patterns = list(dict.fromkeys(packages))
+    if stat_cache is None:
+        stat_cache = {}
+    # Resolved sequentially: each pattern is a few cached stat/find_spec
+    # calls, which a thread pool only slows down
+    for pattern in unique_patterns:
+        for pkg in _resolve_package_pattern(pattern, cwd, stat_cache=stat_cache):
+            # Patterns are joined lexically; realpath only the few matches,
+            # since duplicates by real path would be archived twice
+            real = os.path.realpath(pkg)
+            if real not in seen:
+                seen.add(real)
+                logger.debug("Resolved package pattern '%s' to: %s", pattern, real)
+                yield Path(real)
+
+
+def _resolve_packages(
+    packages: list[str],
+    cwd: Path,
+    stat_cache: dict[str, StatKind] | None = None,
+) -> list[Path]:
+    """Resolve multiple package patterns to actual package paths.
 
-    for pattern in packages:
-        resolved = _resolve_package_pattern(pattern, cwd)
-        for pkg in resolved:
-            if pkg not in all_packages:
-                all_packages.append(pkg)
-                logger.debug("Resolved package pattern '%s' to: %s", pattern, pkg)
+    Args:
+        packages: List of package patterns
+        cwd: Current working directory
+        stat_cache: Optional path-kind cache to share with later lookups
+            in the same build
 
+    Returns:
+        List of unique resolved package Path objects
+    """
+    all_packages = list(_iter_resolved_packages(packages, cwd, stat_cache))
     if not all_packages:
-        logger.warning("No packages resolved from patterns: %s", packages)
-
+        getAppLogger().warning("No packages resolved from patterns: %s", packages)
     return all_packages
 
 
+@functools.lru_cache(maxsize=64)
 def extract_entry_point_code(entry_point: str) -> str:
     """Extract entry point code from entry point string.
 
+    Results are cached, since the same entry point is often passed through
+    both the CLI and the config.
+
     Args:
         entry_point: Entry point in format "module:function" or "module"
 
     Returns:
         Python code to execute the entry point
+
+    Raises:
+        ValueError: If entry_point is not a dotted module path, optionally
+            followed by ":function"
     """
-    if ":" in entry_point:
-        module, function = entry_point.rsplit(":", 1)
-        return f"from {module} import {function}\n{function}()"
+    parsed = split_entry_point(entry_point)
+    if parsed is None:
+        msg = (
+            f"Invalid entry point format: '{entry_point}'. "
+            "Expected format: 'module.path:function' or 'module.path'"
+        )
+        raise ValueError(msg)
+
+    module, function = parsed
+    if function is not None:
+        # "module:obj.attr" imports the top-level object and calls through it
+        target = function.split(".", 1)[0]
+        return f"from {module} import {target}\n{function}()"
     # Just module - import and run __main__ or main
-    code_lines = [
-        f"import {entry_point}",
-        f"if hasattr({entry_point}, '__main__'):",
-        f"    {entry_point}.__main__()",
-        f"elif hasattr({entry_point}, 'main'):",
-        f"    {entry_point}.main()",
-    ]
-    return "\n".join(code_lines)
+    return (
+        f"import {module}\n"
+        f"if hasattr({module}, '__main__'):\n"
+        f"    {module}.__main__()\n"
+        f"elif hasattr({module}, 'main'):\n"
+        f"    {module}.main()"
+    )
 
 
 def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR0911, PLR0912, PLR0915
@@ -278,8 +729,10 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
     logger = getAppLogger()
 
     cwd = Path.cwd().resolve()
-    config_path_str = getattr(args, "config", None)
-    strict = getattr(args, "strict", False)
+    # One dict view of the parsed args; missing options read as None/False
+    args_dict = vars(args)
+    config_path_str = args_dict.get("config")
+    strict = args_dict.get("strict", False)
 
     try:
         result = load_and_validate_config(
@@ -306,14 +759,16 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
         packages_list: list[str] = config.get("packages", [])
 
         # CLI args override config
-        if hasattr(args, "include") and args.include:
-            packages_list = args.include
+        if args_dict.get("include"):
+            packages_list = args_dict["include"]
 
         if not packages_list:
             logger.error("No packages specified in configuration")
             return 1
 
-        packages = _resolve_packages(packages_list, cwd)
+        # Paths are classified once per build, across packages and includes
+        stat_cache: dict[str, StatKind] = {}
+        packages = _resolve_packages(packages_list, cwd, stat_cache)
         if not packages:
             logger.error("No valid packages found from patterns: %s", packages_list)
             return 1
@@ -323,7 +778,7 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
         # - CLI includes (--include, --add-include) are relative to cwd
         config_dir = config_path.parent.resolve()
         # Cast to dict[str, object] for resolve_includes function
-        raw_config = cast_hint(dict[str, object], config)
+        raw_config = cast("dict[str, object]", config)
         resolved_includes = resolve_includes(
             raw_config, args=args, config_dir=config_dir, cwd=cwd
         )
@@ -331,20 +786,30 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
         # Separate includes into packages, additional files, and zips
         additional_includes: list[tuple[Path, Path | None]] = []
         zip_includes: list[tuple[Path, Path | None]] = []
-        for inc in resolved_includes:
-            full_path = inc["path"]
-            if isinstance(full_path, Path):
-                full_path_resolved = full_path
-            else:
-                # Path is relative to root
-                full_path_resolved = (inc["root"] / full_path).resolve()
-
+        # Set mirror of packages for O(1) duplicate checks; list keeps order
+        known_packages = set(packages)
+        # Paths are relative to their include root unless already a Path;
+        # realpath them so a symlinked include matches its target package
+        include_paths = [
+            (
+                inc,
+                inc["path"]
+                if isinstance(inc["path"], Path)
+                else Path(
+                    os.path.realpath(os.path.join(inc["root"], str(inc["path"])))  # noqa: PTH118
+                ),
+            )
+            for inc in resolved_includes
+        ]
+        # Sibling includes share one directory listing instead of a stat each
+        _prime_stat_cache((str(path) for _, path in include_paths), stat_cache)
+        for inc, full_path_resolved in include_paths:
             dest = inc.get("dest")
             include_type = inc.get("type", "file")
 
             # Handle zip includes
             if include_type == "zip":
-                if full_path_resolved.is_file():
+                if _stat_kind(full_path_resolved, stat_cache) == "file":
                     zip_includes.append((full_path_resolved, dest))
                     logger.debug(
                         "Added zip include (origin: %s): %s -> %s",
@@ -363,7 +828,9 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
             # (handles cases like 'extra/pkg2' or glob patterns)
             try:
                 rel_to_cwd = full_path_resolved.relative_to(cwd)
-                resolved_pkgs = _resolve_package_pattern(str(rel_to_cwd), cwd)
+                resolved_pkgs = _resolve_package_pattern(
+                    str(rel_to_cwd), cwd, stat_cache=stat_cache
+                )
             except ValueError:
                 # full_path_resolved is outside cwd, skip package resolution
                 resolved_pkgs = []
@@ -371,14 +838,15 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
             if resolved_pkgs:
                 # It's a package directory (or glob pattern matching dirs)
                 for pkg in resolved_pkgs:
-                    if pkg not in packages:
+                    if pkg not in known_packages:
+                        known_packages.add(pkg)
                         packages.append(pkg)
                         logger.debug(
                             "Added package from include (origin: %s): %s",
                             inc["origin"],
                             pkg,
                         )
-            elif full_path_resolved.is_file():
+            elif _stat_kind(full_path_resolved, stat_cache) == "file":
                 # It's a file - track for inclusion
                 additional_includes.append((full_path_resolved, dest))
                 logger.debug(
@@ -403,7 +871,8 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
             "Resolved output path from config: %s",
             output_path,
         )
-        output = (cwd / output_path).resolve()
+        # cwd is already canonical, so lexical normalization is enough
+        output = _join_normalized(cwd, str(output_path))
 
         # Extract entry point
         entry_point_str: str | None = config.get("entry_point")
@@ -422,19 +891,16 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
         respect_gitignore = resolve_gitignore(raw_config, args=args)
         if respect_gitignore:
             gitignore_path = config_dir / ".gitignore"
-            patterns = load_gitignore_patterns(gitignore_path)
-            if patterns:
+            excludes_before = len(excludes)
+            excludes.extend(
+                make_exclude_resolved(pattern, config_dir, "gitignore")
+                for pattern in iter_gitignore_patterns(gitignore_path)
+            )
+            if len(excludes) > excludes_before:
                 logger.trace(
                     "[build_command] Adding %d .gitignore patterns to excludes",
-                    len(patterns),
+                    len(excludes) - excludes_before,
                 )
-                for pattern in patterns:
-                    exc = {
-                        "path": pattern,
-                        "root": config_dir,
-                        "origin": "gitignore",
-                    }
-                    excludes.append(exc)  # type: ignore[arg-type]
 
         # Extract metadata with cascading priority:
         # 1. Config metadata (if provided)
@@ -448,13 +914,19 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
                 logger.warning("metadata field must be an object, ignoring")
             else:
                 # Convert metadata dict to dict[str, str],
-                # filtering out non-string values
-                metadata = {}
-                for key, value in metadata_config.items():
-                    if isinstance(value, str):
-                        metadata[key] = value
-                    else:
-                        logger.warning("metadata.%s must be a string, ignoring", key)
+                # filtering out non-string values (parsed configs only hold
+                # exact str, so a type check is enough)
+                metadata = {
+                    key: value
+                    for key, value in metadata_config.items()
+                    if type(value) is str
+                }
+                if len(metadata) != len(metadata_config):
+                    for key in metadata_config:
+                        if key not in metadata:
+                            logger.warning(
+                                "metadata.%s must be a string, ignoring", key
+                            )
 
         # If no metadata from config, try extracting from pyproject.toml
         # (controlled by DEFAULT_USE_PYPROJECT_METADATA)
@@ -505,16 +977,14 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
                     compression = "deflate" if compression_val else "stored"
 
             # Compression level
-            if "compression_level" in options:
-                compression_level_val = options["compression_level"]
-                if isinstance(compression_level_val, int):  # pyright: ignore[reportUnnecessaryIsInstance]
-                    compression_level = compression_level_val
+            compression_level_val = options.get("compression_level")
+            if isinstance(compression_level_val, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+                compression_level = compression_level_val
 
             # Main guard
-            if "main_guard" in options:
-                main_guard_val = options["main_guard"]
-                if isinstance(main_guard_val, bool):  # pyright: ignore[reportUnnecessaryIsInstance]
-                    main_guard = main_guard_val
+            main_guard_val = options.get("main_guard")
+            if isinstance(main_guard_val, bool):  # pyright: ignore[reportUnnecessaryIsInstance]
+                main_guard = main_guard_val
 
         # Resolve compress boolean (CLI + config + default)
         # Priority: CLI flag > config > default
@@ -522,33 +992,27 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
 
         # Resolve disable_build_timestamp (CLI + env var + default)
         # Priority: CLI flag (if True) > env var > default
-        if getattr(args, "disable_build_timestamp", False):
+        if args_dict.get("disable_build_timestamp"):
             # CLI flag --disable-build-timestamp was explicitly provided
             disable_build_timestamp = True
         else:
             # Check environment variable
             env_disable = os.getenv("DISABLE_BUILD_TIMESTAMP")
             if env_disable is not None:
-                # Parse boolean from string (accept "true", "1", "yes", "on")
-                disable_build_timestamp = env_disable.lower() in (
-                    "true",
-                    "1",
-                    "yes",
-                    "on",
-                )
+                disable_build_timestamp = env_disable.strip().lower() in _TRUTHY_ENV
             else:
                 # Use default from constants
                 disable_build_timestamp = DEFAULT_DISABLE_BUILD_TIMESTAMP
 
         # CLI args override config
-        if hasattr(args, "output") and args.output:
-            output = Path(args.output).resolve()
+        if args_dict.get("output"):
+            output = _join_normalized(cwd, args_dict["output"])
 
         # Handle input archive (CLI only, not in config)
         input_archive: Path | None = None
         preserve_input_files = True  # Default: preserve files from input archive
-        if hasattr(args, "input") and args.input:
-            input_path = Path(args.input).resolve()
+        if args_dict.get("input"):
+            input_path = Path(args_dict["input"]).resolve()
 
             # Check if it's a directory - if so, resolve the zip file name
             # using the output file name
@@ -563,11 +1027,12 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
                 logger.debug("Input archive: %s", input_archive)
 
             # Validate that the input exists and is a valid zip file
-            if not input_archive.exists():
+            input_kind = _stat_kind(input_archive)
+            if input_kind == "missing":
                 logger.error("Input archive not found: %s", input_archive)
                 return 1
 
-            if not input_archive.is_file():
+            if input_kind != "file":
                 logger.error("Input archive is not a file: %s", input_archive)
                 return 1
 
@@ -575,7 +1040,7 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
             # on input_mode:
             # - APPEND mode (default): preserve existing files, merge with new
             # - REPLACE mode: wipe existing files, use only new packages
-            input_mode = getattr(args, "input_mode", "append")
+            input_mode = args_dict.get("input_mode", "append")
             if input_mode == "replace":
                 preserve_input_files = False
                 logger.debug(
@@ -589,34 +1054,31 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
                     "will merge with existing files from input archive"
                 )
 
-        if hasattr(args, "entry_point"):
-            # Handle entry_point: None (not specified), False (--no-main),
-            # or string value (from --main)
-            if args.entry_point is False:
-                # --no-main explicitly disables entry point
-                entry_point_code = None
-            elif args.entry_point:
-                # --main was specified with a value
-                entry_point_code = extract_entry_point_code(args.entry_point)
-        if hasattr(args, "shebang"):
-            # Handle --no-shebang (False) or --python/-p (string)
-            if args.shebang is False:
-                shebang = None
-            elif args.shebang:
-                if args.shebang.startswith("#!"):
-                    shebang = args.shebang
-                else:
-                    shebang = f"#!{args.shebang}"
-        if hasattr(args, "compression_level") and args.compression_level is not None:
-            compression_level = args.compression_level
+        # Handle entry_point: None (not specified), False (--no-main),
+        # or string value (from --main)
+        cli_entry_point = args_dict.get("entry_point")
+        if cli_entry_point is False:
+            # --no-main explicitly disables entry point
+            entry_point_code = None
+        elif cli_entry_point:
+            # --main was specified with a value
+            entry_point_code = extract_entry_point_code(cli_entry_point)
+        # Handle --no-shebang (False) or --python/-p (string)
+        cli_shebang = args_dict.get("shebang")
+        if cli_shebang is False:
+            shebang = None
+        elif cli_shebang:
+            if cli_shebang.startswith("#!"):
+                shebang = cli_shebang
+            else:
+                shebang = f"#!{cli_shebang}"
+        if args_dict.get("compression_level") is not None:
+            compression_level = args_dict["compression_level"]
             # compression_level only applies to deflate, ensure compression is deflate
             if compression != "deflate":
                 compression = "deflate"
-        if hasattr(args, "main_guard") and args.main_guard is not None:
-            main_guard = args.main_guard
-        if hasattr(args, "dry_run") and args.dry_run:
-            # Handle dry_run if provided
-            pass
+        if args_dict.get("main_guard") is not None:
+            main_guard = args_dict["main_guard"]
 
         # Apply compress boolean to determine compression method
         # If compress=False, use "stored" (no compression)
@@ -641,9 +1103,9 @@ def handle_build_command(args: argparse.Namespace) -> int:  # noqa: C901, PLR091
             compression_level=compression_level,
             exclude=excludes,
             main_guard=main_guard,
-            dry_run=getattr(args, "dry_run", False),
+            dry_run=args_dict.get("dry_run", False),
             metadata=metadata,
-            force=getattr(args, "force", False),
+            force=args_dict.get("force", False),
             additional_includes=additional_includes if additional_includes else None,
             zip_includes=zip_includes if zip_includes else None,
             disable_build_timestamp=disable_build_timestamp,
@@ -7,7 +7,7 @@ from pathlib import Path
 
 from apathetic_logging import Logger
 
-from zipbundler.build import get_interpreter, get_metadata_from_archive
+from zipbundler.build import get_archive_info
 from zipbundler.logs import getAppLogger
 
 
@@ -60,15 +60,16 @@ def handle_info_command(
         archive_path = source_path
 
     try:
+        # Interpreter and metadata come from a single open of the archive
+        interpreter, metadata = get_archive_info(archive_path)
+
         # Display interpreter
-        interpreter = get_interpreter(archive_path)
         if interpreter is None:
             logger.info("No interpreter specified in archive")
         else:
             logger.info("Interpreter: %s", interpreter)
 
         # Display metadata if present
-        metadata = get_metadata_from_archive(archive_path)
         if metadata:
             _display_metadata(logger, metadata)
     except (FileNotFoundError, ValueError):
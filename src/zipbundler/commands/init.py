@@ -4,6 +4,7 @@
 
 import argparse
 import json
+import os
 import tempfile
 from pathlib import Path
 from typing import Any
@@ -55,6 +56,9 @@ DEFAULT_CONFIG_TEMPLATE = """{
 }
 """
 
+# Encoded once; written as-is when nothing is injected from pyproject.toml
+_DEFAULT_CONFIG_BYTES = DEFAULT_CONFIG_TEMPLATE.encode("utf-8")
+
 
 def _extract_entry_point_from_pyproject(cwd: Path) -> str | None:  # noqa: PLR0911
     """Extract entry point from pyproject.toml if it exists.
@@ -390,13 +394,6 @@ def handle_init_command(args: argparse.Namespace) -> int:
 
     config_path = Path(args.config or f".{PROGRAM_CONFIG}.jsonc")
 
-    if config_path.exists() and not args.force:
-        logger.error(
-            "Configuration file already exists: %s\nUse --force to overwrite.",
-            config_path,
-        )
-        return 1
-
     # Try to auto-detect metadata and entry_point from pyproject.toml
     # (controlled by DEFAULT_USE_PYPROJECT_METADATA)
     cwd = Path.cwd().resolve()
@@ -416,11 +413,24 @@ def handle_init_command(args: argparse.Namespace) -> int:
         )
         config_content = _inject_entry_point_into_config(config_content, entry_point)
 
-    # Write config file
+    # Write config file; O_EXCL makes the existence check part of the open
+    payload = (
+        _DEFAULT_CONFIG_BYTES
+        if config_content is DEFAULT_CONFIG_TEMPLATE
+        else config_content.encode("utf-8")
+    )
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if args.force else os.O_EXCL)
     result = 0
     try:
-        config_path.write_text(config_content, encoding="utf-8")
+        with os.fdopen(os.open(config_path, flags, 0o666), "wb") as f:
+            f.write(payload)
         logger.info("Created configuration file: %s", config_path)
+    except FileExistsError:
+        logger.error(  # noqa: TRY400
+            "Configuration file already exists: %s\nUse --force to overwrite.",
+            config_path,
+        )
+        result = 1
     except OSError:
         logger.exception("Failed to create configuration file")
         result = 1
@@ -3,14 +3,70 @@
 """Handle the list subcommand."""
 
 import argparse
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+
+from apathetic_logging import DETAIL_LEVEL
 
 from zipbundler.build import list_files, list_files_from_archive
 from zipbundler.commands.zipapp_style import is_archive_file
 from zipbundler.logs import getAppLogger
 
 
+def _common_prefix_len(a: tuple[str, ...], b: tuple[str, ...]) -> int:
+    """Return the number of leading path components shared by `a` and `b`."""
+    limit = min(len(a), len(b))
+    i = 0
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _render_tree(files: Iterable[tuple[Path, Path]], lines: list[str]) -> None:
+    """Render (path, arcname) pairs as a name tree into lines, sorted by name.
+
+    Sorts the arcname component tuples once and derives the connectors by
+    diffing neighbouring paths, instead of building a nested dict per
+    directory and sorting every level.
+    """
+    paths = sorted({arcname.parts for _file_path, arcname in files})
+    count = len(paths)
+    if not count:
+        return
+
+    # Backward pass: whether each component has a later sibling. A path
+    # shares its next neighbour's flags above their common prefix, the
+    # diverging component has a sibling, and deeper components do not.
+    has_sibling: list[list[bool]] = [[]] * count
+    next_flags: list[bool] = []
+    for index in range(count - 1, -1, -1):
+        parts = paths[index]
+        if index == count - 1:
+            flags = [False] * len(parts)
+        else:
+            common = _common_prefix_len(parts, paths[index + 1])
+            flags = next_flags[:common]
+            if common < len(parts):
+                flags.append(True)
+                flags.extend([False] * (len(parts) - common - 1))
+        has_sibling[index] = flags
+        next_flags = flags
+
+    # Forward pass: emit only the components not shared with the previous
+    # path, reusing the indentation built for the shared ones
+    append = lines.append
+    indents: list[str] = []
+    previous: tuple[str, ...] = ()
+    for parts, flags in zip(paths, has_sibling, strict=True):
+        common = _common_prefix_len(parts, previous)
+        del indents[common:]
+        for depth in range(common, len(parts)):
+            connector = "├── " if flags[depth] else "└── "
+            append(f"{''.join(indents)}{connector}{parts[depth]}")
+            indents.append("│   " if flags[depth] else "    ")
+        previous = parts
+
+
 def handle_list_command(args: argparse.Namespace) -> int:
     """Handle the list subcommand."""
     logger = getAppLogger()
@@ -30,13 +86,9 @@ def handle_list_command(args: argparse.Namespace) -> int:
                 logger.error("Only one archive file can be listed at a time")
                 return 1
 
-            archive_path = sources[0]
-            if not is_archive_file(archive_path):
-                logger.error("Source must be an archive file (.pyz) or directory")
-                return 1
-
+            # A single source that made `is_archive` true is the archive
             # Always get files (not count-only) so we can build tree
-            files = list_files_from_archive(archive_path, count=False)
+            files = list_files_from_archive(sources[0], count=False)
         else:
             # Handle directory sources (existing behavior)
             packages = sources
@@ -47,34 +99,13 @@ def handle_list_command(args: argparse.Namespace) -> int:
         file_count = len(files)
         logger.brief("Files: %d", file_count)
 
-        # Always build and show tree at detail level
-        tree: dict[str, Any] = {}
-        for _file_path, arcname in files:
-            parts = arcname.parts
-            current: dict[str, Any] = tree
-            for part in parts[:-1]:
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
-            # Add file
-            if parts and parts[-1] not in current:
-                current[parts[-1]] = None
-
-        def print_tree(
-            node: dict[str, Any],
-            prefix: str = "",
-        ) -> None:
-            """Print tree structure recursively."""
-            items = sorted(node.items())
-            for i, (name, children) in enumerate(items):
-                is_last_item = i == len(items) - 1
-                connector = "└── " if is_last_item else "├── "
-                logger.detail(f"{prefix}{connector}{name}")
-                if children is not None:
-                    extension = "    " if is_last_item else "│   "
-                    print_tree(children, prefix + extension)
-
-        print_tree(tree)
+        # Build and show tree only at detail level, as one record instead of
+        # one per entry
+        if logger.isEnabledFor(DETAIL_LEVEL):
+            tree_lines: list[str] = []
+            _render_tree(files, tree_lines)
+            if tree_lines:
+                logger.detail("\n".join(tree_lines))
         result = 0
     except (ValueError, FileNotFoundError) as e:
         logger.errorIfNotDebug(str(e))
@@ -10,7 +10,8 @@ from zipbundler.build import build_zipapp
 from zipbundler.constants import DEFAULT_RESPECT_GITIGNORE, DEFAULT_WATCH_INTERVAL
 from zipbundler.logs import getAppLogger
 from zipbundler.utils import (
-    load_gitignore_patterns,
+    iter_gitignore_patterns,
+    make_exclude_resolved,
     resolve_excludes,
 )
 
@@ -48,41 +49,42 @@ def handle_watch_command(args: argparse.Namespace) -> int:
             respect_gitignore = DEFAULT_RESPECT_GITIGNORE
         if respect_gitignore:
             gitignore_path = cwd / ".gitignore"
-            patterns = load_gitignore_patterns(gitignore_path)
-            if patterns:
+            excludes_before = len(excludes)
+            excludes.extend(
+                make_exclude_resolved(pattern, cwd, "gitignore")
+                for pattern in iter_gitignore_patterns(gitignore_path)
+            )
+            if len(excludes) > excludes_before:
                 logger.trace(
                     "[watch_command] Adding %d .gitignore patterns to excludes",
-                    len(patterns),
+                    len(excludes) - excludes_before,
                 )
-                for pattern in patterns:
-                    exc = {
-                        "path": pattern,
-                        "root": cwd,
-                        "origin": "gitignore",
-                    }
-                    excludes.append(exc)  # type: ignore[arg-type]
+
+        # Resolve build settings once; they do not change between rebuilds
+        compression = "deflate" if getattr(args, "compress", False) else "stored"
+        # Handle entry_point: None (not specified), False (--no-main),
+        # or string value (from --main)
+        entry_point_code: str | None = None
+        entry_point_str = getattr(args, "entry_point", None)
+        if entry_point_str is False:
+            # --no-main explicitly disables entry point
+            entry_point_code = None
+        elif entry_point_str:
+            # --main was specified with a value
+            entry_point_code = entry_point_str
+        shebang = args.shebang or "#!/usr/bin/env python3"
+        main_guard = getattr(args, "main_guard", True)
 
         # Build rebuild function
         def rebuild() -> None:
-            compression = "deflate" if getattr(args, "compress", False) else "stored"
-            # Handle entry_point: None (not specified), False (--no-main),
-            # or string value (from --main)
-            entry_point_code: str | None = None
-            entry_point_str = getattr(args, "entry_point", None)
-            if entry_point_str is False:
-                # --no-main explicitly disables entry point
-                entry_point_code = None
-            elif entry_point_str:
-                # --main was specified with a value
-                entry_point_code = entry_point_str
             build_zipapp(
                 output=output,
                 packages=packages,
                 entry_point=entry_point_code,
-                shebang=args.shebang or "#!/usr/bin/env python3",
+                shebang=shebang,
                 compression=compression,
                 exclude=excludes,
-                main_guard=getattr(args, "main_guard", True),
+                main_guard=main_guard,
                 force=False,  # Watch handles change detection, use incremental builds
             )
 
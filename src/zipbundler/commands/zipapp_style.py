@@ -14,6 +14,19 @@ from zipbundler.commands.build import extract_entry_point_code
 from zipbundler.logs import getAppLogger
 
 
+# Bytes read to sniff a shebang line and the zip magic that follows it
+_ARCHIVE_SNIFF_SIZE = 512
+
+# Local file header, empty archive (end of central directory), spanned archive
+_ZIP_MAGICS = frozenset({b"PK\x03\x04", b"PK\x05\x06", b"PK\x07\x08"})
+
+
+# Source and text suffixes that are never sniffed for zip data
+_NON_ARCHIVE_SUFFIXES = frozenset(
+    {".py", ".txt", ".md", ".rst", ".json", ".jsonc", ".toml", ".cfg", ".ini"}
+)
+
+
 def is_archive_file(source: Path) -> bool:
     """Check if source is a zipapp archive file.
 
@@ -23,22 +36,32 @@ def is_archive_file(source: Path) -> bool:
     Returns:
         True if source appears to be a .pyz archive file
     """
-    if not source.exists() or not source.is_file():
+    if not source.is_file():
         return False
     # Check extension
-    if source.suffix == ".pyz":
+    suffix = source.suffix
+    if suffix == ".pyz":
         return True
-    # Check if it starts with shebang and contains zip data
+    if suffix in _NON_ARCHIVE_SUFFIXES:
+        return False
+    # Check if it starts with a shebang followed by zip data. peek() fills
+    # the read buffer with one read without advancing, so even the
+    # long-shebang fallback below is normally served from that buffer.
+    # Bare zip data (.zip, .whl, ...) is not treated as a zipapp.
     try:
         with source.open("rb") as f:
-            first_two = f.read(2)
-            if first_two == b"#!":
-                # Skip shebang line
+            head = f.peek(_ARCHIVE_SNIFF_SIZE)[:_ARCHIVE_SNIFF_SIZE]
+            if not head.startswith(b"#!"):
+                return False
+            newline = head.find(b"\n")
+            if newline == -1:
+                # Unusually long shebang: skip the whole line
                 f.readline()
-                # Check if remaining data looks like a zip file
-                # ZIP files start with PK\x03\x04 or PK\x05\x06 or PK\x07\x08
-                zip_magic = f.read(2)
-                return zip_magic in (b"PK\x03", b"PK\x05", b"PK\x07")
+                head = f.read(4)
+            else:
+                head = head[newline + 1 :]
+            # ZIP files start with PK\x03\x04 or PK\x05\x06 or PK\x07\x08
+            return head[:4] in _ZIP_MAGICS
     except Exception as e:  # noqa: BLE001
         # Log exception for debugging but don't fail
         logger = getAppLogger()
@@ -68,15 +91,43 @@ def handle_zipapp_style_command(args: argparse.Namespace) -> int:  # noqa: C901,
         logger.error("SOURCE is required")
         return 1
 
-    source = Path(source_str).resolve()
-    if not source.exists():
-        logger.error("SOURCE not found: %s", source)
+    # Detect the source kind on the raw path; symlinks are only resolved
+    # once we know the source exists and what to do with it
+    source_raw = Path(source_str)
+    if not source_raw.exists():
+        logger.error("SOURCE not found: %s", source_raw)
+        return 1
+
+    # Resolve options that can fail before extracting an archive SOURCE,
+    # so an early return never leaves a temporary directory behind
+    output_str = getattr(args, "output", None)
+    if not output_str:
+        logger.error("Output file (-o/--output) is required when using SOURCE")
         return 1
 
+    output = Path(output_str).resolve()
+
+    # Extract entry point
+    entry_point_str = getattr(args, "entry_point", None)
+    entry_point_code: str | None = None
+    # Handle entry_point: None (not specified), False (--no-main),
+    # or string value (from --main)
+    if entry_point_str is False:
+        # --no-main explicitly disables entry point
+        entry_point_code = None
+    elif entry_point_str:
+        # --main was specified with a value
+        try:
+            entry_point_code = extract_entry_point_code(entry_point_str)
+        except ValueError as e:
+            logger.errorIfNotDebug(str(e))
+            return 1
+
     # Check if source is an archive
     temp_dir: Path | None = None
     packages: list[Path] = []
-    if is_archive_file(source):
+    source = source_raw.resolve()
+    if is_archive_file(source_raw):
         logger.debug("SOURCE is an archive file, extracting to temporary directory")
         try:
             temp_dir = extract_archive_to_tempdir(source)
@@ -126,40 +177,17 @@ def handle_zipapp_style_command(args: argparse.Namespace) -> int:  # noqa: C901,
         logger.error("SOURCE must be a directory or .pyz archive file: %s", source)
         return 1
 
-    # Extract options from args
-    output_str = getattr(args, "output", None)
-    if not output_str:
-        logger.error("Output file (-o/--output) is required when using SOURCE")
-        return 1
-
-    output = Path(output_str).resolve()
-
-    # Extract entry point
-    entry_point_str = getattr(args, "entry_point", None)
-    entry_point_code: str | None = None
-    # Handle entry_point: None (not specified), False (--no-main),
-    # or string value (from --main)
-    if entry_point_str is False:
-        # --no-main explicitly disables entry point
-        entry_point_code = None
-    elif entry_point_str:
-        # --main was specified with a value
-        entry_point_code = extract_entry_point_code(entry_point_str)
-
     # Extract shebang
     # Match Python's zipapp behavior: no shebang by default, only when -p is specified
     shebang: str | None = None
-    if hasattr(args, "shebang"):
-        if args.shebang is False:
-            # --no-shebang explicitly disables shebang
-            shebang = None
-        elif args.shebang:
-            # -p/--python was specified, use it
-            if args.shebang.startswith("#!"):
-                shebang = args.shebang
-            else:
-                shebang = f"#!{args.shebang}"
-        # else: args.shebang is None (default), no shebang (matches zipapp behavior)
+    shebang_arg = getattr(args, "shebang", None)
+    if shebang_arg is False:
+        # --no-shebang explicitly disables shebang
+        shebang = None
+    elif shebang_arg:
+        # -p/--python was specified, use it
+        shebang = shebang_arg if shebang_arg.startswith("#!") else f"#!{shebang_arg}"
+    # else: shebang is None (default), no shebang (matches zipapp behavior)
 
     # Extract compression
     compress = getattr(args, "compress", False)
@@ -18,7 +18,7 @@ from .config_types import (
     OutputConfig,
     RootConfig,
 )
-from .config_validate import validate_config
+from .config_validate import split_entry_point, validate_config
 
 
 __all__ = [  # noqa: RUF022
@@ -34,5 +34,6 @@ __all__ = [  # noqa: RUF022
     "OutputConfig",
     "RootConfig",
     # config_validate
+    "split_entry_point",
     "validate_config",
 ]
@@ -2,8 +2,11 @@
 
 """Configuration loading and parsing for zipbundler."""
 
+import os
+import stat
 import sys
 import traceback
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, cast
 
@@ -18,6 +21,27 @@ from .config_types import RootConfig
 from .config_validate import validate_config
 
 
+# Default config file names, in priority order
+_CANDIDATE_NAMES = (
+    ".zipbundler.py",
+    ".zipbundler.jsonc",
+    ".zipbundler.json",
+    "pyproject.toml",
+)
+
+
+def _present_candidates(directory: Path) -> tuple[str, ...]:
+    """Return the default config names present in directory, in priority order."""
+    # One directory listing per level instead of a stat per candidate
+    try:
+        with os.scandir(directory) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        # Unlistable directory: fall back to probing each candidate
+        return tuple(name for name in _CANDIDATE_NAMES if (directory / name).exists())
+    return tuple(name for name in _CANDIDATE_NAMES if name in names)
+
+
 def _search_default_configs(
     cwd: Path,
 ) -> list[tuple[Path, dict[str, Any]]]:
@@ -33,26 +57,19 @@ def _search_default_configs(
     """
     logger = getAppLogger()
     current = cwd
-    candidate_names = [
-        ".zipbundler.py",
-        ".zipbundler.jsonc",
-        ".zipbundler.json",
-        "pyproject.toml",
-    ]
     found: list[tuple[Path, dict[str, Any]]] = []
 
     while True:
-        for name in candidate_names:
+        for name in _present_candidates(current):
             candidate = current / name
-            if candidate.exists():
-                # Try to load the config file
-                try:
-                    raw_config = load_config(candidate)
-                    if raw_config is not None:
-                        found.append((candidate, raw_config))
-                except (ValueError, TypeError, RuntimeError) as e:
-                    # Log at TRACE and skip this file
-                    logger.trace(f"[find_config] Skipping {candidate.name}: {e}")
+            # Try to load the config file
+            try:
+                raw_config = load_config(candidate)
+                if raw_config is not None:
+                    found.append((candidate, raw_config))
+            except (ValueError, TypeError, RuntimeError) as e:
+                # Log at TRACE and skip this file
+                logger.trace(f"[find_config] Skipping {candidate.name}: {e}")
         if found:
             # Found at least one valid config file at this level
             break
@@ -98,10 +115,13 @@ def find_config(
     if config_path:
         config = Path(config_path).expanduser().resolve()
         logger.trace(f"[find_config] Checking explicit path: {config}")
-        if not config.exists():
+        # One stat answers both "missing" and "is a directory"
+        try:
+            config_mode = config.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError):
             msg = f"Specified config file not found: {config}"
-            raise FileNotFoundError(msg)
-        if config.is_dir():
+            raise FileNotFoundError(msg) from None
+        if stat.S_ISDIR(config_mode):
             msg = f"Specified config path is a directory, not a file: {config}"
             raise ValueError(msg)
         # Load the explicit config file
@@ -119,20 +139,14 @@ def find_config(
 
     # --- 3. Handle multiple matches at same level ---
     # Prefer .zipbundler.py > .zipbundler.jsonc > .zipbundler.json >
-    # pyproject.toml
+    # pyproject.toml; matches are already in _CANDIDATE_NAMES priority order
     if len(found) > 1:
-        # Prefer .py, then .jsonc, then .json, then .toml
-        priority = {".py": 0, ".jsonc": 1, ".json": 2, ".toml": 3}
-        found_sorted = sorted(found, key=lambda p: priority.get(p[0].suffix, 99))
-        names = ", ".join(p[0].name for p in found_sorted)
+        names = ", ".join(p[0].name for p in found)
         logger.warning(
             "Multiple config files detected (%s); using %s.",
             names,
-            found_sorted[0][0].name,
+            found[0][0].name,
         )
-        config_path_result, config_data = found_sorted[0]
-        logger.trace(f"[find_config] Found config: {config_path_result}")
-        return config_path_result, config_data
 
     config_path_result, config_data = found[0]
     logger.trace(f"[find_config] Found config: {config_path_result}")
@@ -218,7 +232,8 @@ def _load_toml_config(config_path: Path) -> dict[str, Any]:
         if not isinstance(data, dict):
             msg = f"Config file must contain a TOML object, got {type(data).__name__}"
             raise TypeError(msg)  # noqa: TRY301
-        tool_config: dict[str, Any] = data.get("tool", {}).get("zipbundler", {})
+        tool: Any = data.get("tool")
+        tool_config: Any = tool.get("zipbundler") if isinstance(tool, dict) else None
         if not tool_config:
             msg = "No [tool.zipbundler] section found in pyproject.toml"
             raise ValueError(msg)  # noqa: TRY301
@@ -228,6 +243,14 @@ def _load_toml_config(config_path: Path) -> dict[str, Any]:
         raise ValueError(msg) from e
 
 
+# Loaders for data-only config formats, by file suffix
+_DATA_LOADERS: dict[str, Callable[[Path], dict[str, Any]]] = {
+    ".jsonc": _load_jsonc_config,
+    ".json": _load_jsonc_config,
+    ".toml": _load_toml_config,
+}
+
+
 def load_config(config_path: Path) -> dict[str, Any] | None:
     """Load configuration from file.
 
@@ -243,16 +266,12 @@ def load_config(config_path: Path) -> dict[str, Any] | None:
         ValueError: If config file is invalid or cannot be loaded
         RuntimeError: If Python config execution fails
     """
-    if config_path.suffix == ".py" or config_path.name == ".zipbundler.py":
+    # Dispatch on the suffix; the default names all end in their suffix
+    suffix = os.path.splitext(config_path)[1]  # noqa: PTH122
+    if suffix == ".py":
         return _load_python_config(config_path)
-    if config_path.suffix == ".jsonc" or config_path.name == ".zipbundler.jsonc":
-        return _load_jsonc_config(config_path)
-    if config_path.suffix == ".json" or config_path.name == ".zipbundler.json":
-        return _load_jsonc_config(config_path)
-    if config_path.suffix == ".toml" or config_path.name == "pyproject.toml":
-        return _load_toml_config(config_path)
-    # Try JSONC as fallback
-    return _load_jsonc_config(config_path)
+    # .jsonc, .json, and JSONC as fallback for anything else
+    return _DATA_LOADERS.get(suffix, _load_jsonc_config)(config_path)
 
 
 def parse_config(
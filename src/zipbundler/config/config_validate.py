@@ -2,7 +2,8 @@
 
 """Configuration validation using apathetic-schema."""
 
-import re
+import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, cast
 
@@ -29,6 +30,10 @@ SchemaErrorAggregator = ApatheticSchema_SchemaErrorAggregator
 
 MAX_COMPRESSION_LEVEL = 9
 
+# Compression methods accepted in options.compression
+_VALID_COMPRESSION = frozenset({"deflate", "stored", "bzip2", "lzma"})
+_VALID_COMPRESSION_STR = ", ".join(sorted(_VALID_COMPRESSION))
+
 # Field-specific type examples for better error messages
 FIELD_EXAMPLES: dict[str, str] = {
     "root.packages": '["src/my_package", "lib/utils"]',
@@ -53,6 +58,30 @@ FIELD_EXAMPLES: dict[str, str] = {
 # --- helper functions for custom validations ---
 
 
+def split_entry_point(entry_point: str) -> tuple[str, str | None] | None:
+    """Split an entry point into its module path and optional function.
+
+    Format: module.path:function_name or module.path, where the function
+    may also be a dotted attribute path (module.path:obj.attr). Every dotted
+    segment must be a valid Python identifier.
+
+    Args:
+        entry_point: Entry point string
+
+    Returns:
+        (module_path, function) with function None when absent, or None if
+        the entry point is malformed
+    """
+    module_path, sep, function = entry_point.partition(":")
+    if not all(part.isidentifier() for part in module_path.split(".")):
+        return None
+    if not sep:
+        return module_path, None
+    if not all(part.isidentifier() for part in function.split(".")):
+        return None
+    return module_path, function
+
+
 def _validate_entry_point_format(entry_point: str) -> tuple[bool, str]:
     """Validate entry point format.
 
@@ -65,14 +94,7 @@ def _validate_entry_point_format(entry_point: str) -> tuple[bool, str]:
         msg = f"Entry point must be a string, got {type(entry_point).__name__}"
         return False, msg
 
-    # Entry point format: module.path:function or module.path
-    # Module path should be valid Python identifier segments separated by dots
-    # Function name should be a valid Python identifier
-    pattern = (
-        r"^[a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*"
-        r"(?::[a-zA-Z_][a-zA-Z0-9_]*)?$"
-    )
-    if not re.match(pattern, entry_point):
+    if split_entry_point(entry_point) is None:
         msg = (
             f"Invalid entry point format: '{entry_point}'. "
             "Expected format: 'module.path:function' or 'module.path'"
@@ -136,6 +158,13 @@ def _validate_main_name(main_name: str | None) -> tuple[bool, str]:
     return True, ""
 
 
+def _nearest_existing(path: Path) -> Path:
+    """Return path or its closest existing ancestor (the root at worst)."""
+    while not path.exists() and path != path.parent:
+        path = path.parent
+    return path
+
+
 def _validate_output_path_accessibility(
     output_path: str,
     cwd: Path,
@@ -150,21 +179,27 @@ def _validate_output_path_accessibility(
         if not path.is_absolute():
             path = cwd / path
 
-        # Check if parent directory is writable (or can be created)
+        # Check if parent directory exists or can be created, without
+        # touching the filesystem: the nearest existing ancestor must be a
+        # writable directory
         parent = path.parent
         if not parent.exists():
-            # Try to create parent directory to check if it's possible
-            try:
-                parent.mkdir(parents=True, exist_ok=True)
-                # Clean up if we created it
-                if not any(parent.iterdir()):
-                    parent.rmdir()
-            except OSError as e:
-                msg = f"Cannot create output directory '{parent}': {e}"
+            ancestor = _nearest_existing(parent.parent)
+            if not ancestor.is_dir():
+                msg = (
+                    f"Cannot create output directory '{parent}': "
+                    f"'{ancestor}' is not a directory"
+                )
+                return False, msg
+            if not os.access(ancestor, os.W_OK | os.X_OK):
+                msg = (
+                    f"Cannot create output directory '{parent}': "
+                    f"'{ancestor}' is not writable"
+                )
                 return False, msg
 
-        # Check if parent is writable
-        if parent.exists() and not parent.is_dir():
+        # Check if parent is a directory
+        elif not parent.is_dir():
             msg = f"Output path parent is not a directory: {parent}"
             return False, msg
         return True, ""  # noqa: TRY300
@@ -191,139 +226,160 @@ def _set_valid_and_return(
     return summary
 
 
-def _validate_custom_rules(  # noqa: C901, PLR0912, PLR0915
-    parsed_cfg: dict[str, Any],
+def _check_entry_point(
+    entry_point: Any,
+    *,
+    cwd: Path,  # noqa: ARG001
+    strict_config: bool,  # noqa: ARG001
+    summary: ValidationSummary,  # modified
+) -> None:
+    """Validate entry_point format."""
+    is_valid, error_msg = _validate_entry_point_format(entry_point)
+    if not is_valid:
+        collect_msg(
+            error_msg,
+            strict=True,
+            summary=summary,
+            is_error=True,
+        )
+
+
+def _check_output(
+    output: dict[str, Any],
     *,
     cwd: Path,
     strict_config: bool,
     summary: ValidationSummary,  # modified
 ) -> None:
-    """Apply custom validation rules beyond schema validation."""
-    logger = getAppLogger()
-    logger.trace("[validate_custom] Applying custom validation rules")
-
-    # --- Validate entry_point format ---
-    if "entry_point" in parsed_cfg:
-        entry_point = parsed_cfg["entry_point"]
-        is_valid, error_msg = _validate_entry_point_format(entry_point)
+    """Validate output path accessibility."""
+    output_path = output.get("path")
+    if isinstance(output_path, str):
+        is_valid, error_msg = _validate_output_path_accessibility(output_path, cwd)
         if not is_valid:
             collect_msg(
                 error_msg,
-                strict=True,
+                strict=strict_config,
                 summary=summary,
-                is_error=True,
+                is_error=strict_config,
             )
 
-    # --- Validate output path accessibility ---
-    output = parsed_cfg.get("output")
-    if isinstance(output, dict) and "path" in output:  # pyright: ignore[reportUnnecessaryIsInstance]
-        output_path: str = output["path"]  # pyright: ignore[reportUnknownVariableType]
-        if isinstance(output_path, str):
-            is_valid, error_msg = _validate_output_path_accessibility(output_path, cwd)
-            if not is_valid:
-                collect_msg(
-                    error_msg,
-                    strict=strict_config,
-                    summary=summary,
-                    is_error=strict_config,
-                )
 
-    # --- Validate compression options ---
-    options = parsed_cfg.get("options")
-    if isinstance(options, dict):  # pyright: ignore[reportUnnecessaryIsInstance]
-        # Validate shebang (empty string is invalid)
-        shebang = options.get("shebang")  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
-        if isinstance(shebang, str) and not shebang.strip():
+def _check_options(
+    options: dict[str, Any],
+    *,
+    cwd: Path,  # noqa: ARG001
+    strict_config: bool,
+    summary: ValidationSummary,  # modified
+) -> None:
+    """Validate shebang, main and compression options."""
+    # Validate shebang (empty string is invalid)
+    shebang = options.get("shebang")
+    if isinstance(shebang, str) and not shebang.strip():
+        collect_msg(
+            "Field 'options.shebang' must be a non-empty string, boolean, or false",
+            strict=True,
+            summary=summary,
+            is_error=True,
+        )
+
+    # Validate main_mode
+    main_mode = cast("str | None", options.get("main_mode"))
+    if main_mode is not None:
+        is_valid, error_msg = _validate_main_mode(main_mode)
+        if not is_valid:
             collect_msg(
-                "Field 'options.shebang' must be a non-empty string, boolean, or false",
-                strict=True,
+                f"Field 'options.main_mode': {error_msg}",
+                strict=strict_config,
                 summary=summary,
-                is_error=True,
+                is_error=False,
             )
 
-        # Validate main_mode
-        main_mode = cast("str | None", options.get("main_mode"))  # pyright: ignore[reportUnknownMemberType]
-        if main_mode is not None:
-            is_valid, error_msg = _validate_main_mode(main_mode)
-            if not is_valid:
-                collect_msg(
-                    f"Field 'options.main_mode': {error_msg}",
-                    strict=strict_config,
-                    summary=summary,
-                    is_error=False,
-                )
+    # Validate main_name
+    main_name = cast("str | None", options.get("main_name"))
+    if main_name is not None:
+        is_valid, error_msg = _validate_main_name(main_name)
+        if not is_valid:
+            collect_msg(
+                f"Field 'options.main_name': {error_msg}",
+                strict=strict_config,
+                summary=summary,
+                is_error=False,
+            )
 
-        # Validate main_name
-        main_name = cast("str | None", options.get("main_name"))  # pyright: ignore[reportUnknownMemberType]
-        if main_name is not None:
-            is_valid, error_msg = _validate_main_name(main_name)
-            if not is_valid:
-                collect_msg(
-                    f"Field 'options.main_name': {error_msg}",
-                    strict=strict_config,
-                    summary=summary,
-                    is_error=False,
-                )
+    compression: str | None = options.get("compression")
+    compression_level: int | None = options.get("compression_level")
 
-        compression: str | None = options.get("compression")  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
-        compression_level: int | None = options.get("compression_level")  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
+    # Validate compression level range
+    if compression_level is not None:
+        # bool is an int subclass, so check the exact type
+        if type(compression_level) is not int:
+            collect_msg(
+                "Field 'options.compression_level' must be an integer",
+                strict=strict_config,
+                summary=summary,
+                is_error=False,
+            )
+        elif compression_level < 0 or compression_level > MAX_COMPRESSION_LEVEL:
+            collect_msg(
+                f"Field 'options.compression_level' must be between 0 and "
+                f"{MAX_COMPRESSION_LEVEL} (got {compression_level})",
+                strict=strict_config,
+                summary=summary,
+                is_error=False,
+            )
+        elif compression is not None and compression != "deflate":
+            collect_msg(
+                f"Field 'options.compression_level' is only valid when "
+                f"'options.compression' is 'deflate' (got '{compression}')",
+                strict=strict_config,
+                summary=summary,
+                is_error=False,
+            )
 
-        # Validate compression level range
-        if compression_level is not None:
-            if not isinstance(compression_level, int):
-                collect_msg(
-                    "Field 'options.compression_level' must be an integer",
-                    strict=strict_config,
-                    summary=summary,
-                    is_error=False,
-                )
-            elif compression_level < 0 or compression_level > MAX_COMPRESSION_LEVEL:
-                collect_msg(
-                    f"Field 'options.compression_level' must be between 0 and "
-                    f"{MAX_COMPRESSION_LEVEL} (got {compression_level})",
-                    strict=strict_config,
-                    summary=summary,
-                    is_error=False,
-                )
-            elif compression is not None and compression != "deflate":
+    # Validate compression method
+    if compression is not None and compression not in _VALID_COMPRESSION:
+        collect_msg(
+            f"Unknown compression method '{compression}'. "
+            f"Valid options: {_VALID_COMPRESSION_STR}",
+            strict=strict_config,
+            summary=summary,
+            is_error=False,
+        )
+
+
+def _check_include(
+    include: list[Any],
+    *,
+    cwd: Path,  # noqa: ARG001
+    strict_config: bool,
+    summary: ValidationSummary,  # modified
+) -> None:
+    """Validate include types."""
+    # Plain string includes (the common case) carry no type to check
+    if all(type(item) is str for item in include):
+        return
+    for idx, item in enumerate(include):
+        if isinstance(item, dict):
+            item_type = item.get("type")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            if isinstance(item_type, str) and item_type not in ("file", "zip"):
                 collect_msg(
-                    f"Field 'options.compression_level' is only valid when "
-                    f"'options.compression' is 'deflate' (got '{compression}')",
+                    f"Invalid include type at index {idx}: '{item_type}'. "
+                    "Valid options: 'file', 'zip'",
                     strict=strict_config,
                     summary=summary,
                     is_error=False,
                 )
 
-        # Validate compression method
-        valid_compression = {"deflate", "stored", "bzip2", "lzma"}
-        if compression is not None and compression not in valid_compression:
-            valid_str = ", ".join(sorted(valid_compression))
-            collect_msg(
-                f"Unknown compression method '{compression}'. "
-                f"Valid options: {valid_str}",
-                strict=strict_config,
-                summary=summary,
-                is_error=False,
-            )
 
-    # --- Validate include types ---
-    include = parsed_cfg.get("include")
-    if isinstance(include, list):  # pyright: ignore[reportUnknownArgumentType]
-        for idx, item in enumerate(include):  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
-            if isinstance(item, dict):  # pyright: ignore[reportUnnecessaryIsInstance]
-                item_type = item.get("type")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                if isinstance(item_type, str) and item_type not in ("file", "zip"):
-                    collect_msg(
-                        f"Invalid include type at index {idx}: '{item_type}'. "
-                        "Valid options: 'file', 'zip'",
-                        strict=strict_config,
-                        summary=summary,
-                        is_error=False,
-                    )
-
-    # --- Validate empty packages warning ---
-    packages = parsed_cfg.get("packages")
-    if isinstance(packages, list) and len(packages) == 0:  # pyright: ignore[reportUnknownArgumentType]
+def _check_packages(
+    packages: list[Any],
+    *,
+    cwd: Path,  # noqa: ARG001
+    strict_config: bool,
+    summary: ValidationSummary,  # modified
+) -> None:
+    """Warn about an empty packages list."""
+    if not packages:
         collect_msg(
             "Field 'packages' is empty (no packages will be included)",
             strict=strict_config,
@@ -332,6 +388,38 @@ def _validate_custom_rules(  # noqa: C901, PLR0912, PLR0915
         )
 
 
+# Custom rules as (field, required type or None, checker), run in order for
+# each field present in the config with the required type
+_CUSTOM_RULES: tuple[tuple[str, type | None, Callable[..., None]], ...] = (
+    ("entry_point", None, _check_entry_point),
+    ("output", dict, _check_output),
+    ("options", dict, _check_options),
+    ("include", list, _check_include),
+    ("packages", list, _check_packages),
+)
+
+
+def _validate_custom_rules(
+    parsed_cfg: dict[str, Any],
+    *,
+    cwd: Path,
+    strict_config: bool,
+    summary: ValidationSummary,  # modified
+) -> None:
+    """Apply custom validation rules beyond schema validation."""
+    logger = getAppLogger()
+    logger.trace("[validate_custom] Applying custom validation rules")
+
+    for field, expected_type, check in _CUSTOM_RULES:
+        if field not in parsed_cfg:
+            continue
+        value = parsed_cfg[field]
+        if expected_type is not None and not isinstance(value, expected_type):
+            # Wrong top-level types are left to schema validation
+            continue
+        check(value, cwd=cwd, strict_config=strict_config, summary=summary)
+
+
 def _validate_root(
     parsed_cfg: dict[str, Any],
     *,
@@ -1,11 +1,13 @@
 # src/zipbundler/constants.py
 """Central constants used across the project."""
 
-RUNTIME_MODES = {
-    "stitched",  # single concatenated file wiht module-shims
-    "package",  # poetry-installed / pip-installed / importable
-    "zipapp",  # .pyz bundle
-}
+RUNTIME_MODES = frozenset(
+    {
+        "stitched",  # single concatenated file wiht module-shims
+        "package",  # poetry-installed / pip-installed / importable
+        "zipapp",  # .pyz bundle
+    }
+)
 
 # --- env keys ---
 DEFAULT_ENV_LOG_LEVEL: str = "LOG_LEVEL"
@@ -34,15 +36,15 @@ DEFAULT_USE_PYPROJECT_METADATA: bool = True
 
 DEFAULT_COMMENTS_MODE: str = "keep"  # Keep all comments (default comments mode)
 DEFAULT_DOCSTRING_MODE: str = "keep"  # Keep all docstrings (default docstring mode)
-DEFAULT_SOURCE_BASES: list[str] = [
+DEFAULT_SOURCE_BASES: tuple[str, ...] = (
     "src",
     "lib",
     "packages",
-]  # Default directories to search for packages
-DEFAULT_INSTALLED_BASES: list[str] = [
+)  # Default directories to search for packages
+DEFAULT_INSTALLED_BASES: tuple[str, ...] = (
     "site-packages",
     "dist-packages",
-]  # Default subdirectory names for installed packages
+)  # Default subdirectory names for installed packages
 DEFAULT_MAIN_MODE: str = "auto"  # Automatically detect and generate __main__ block
 DEFAULT_MAIN_NAME: str | None = None  # Auto-detect main function (default)
 DEFAULT_DISABLE_BUILD_TIMESTAMP: bool = False  # Use real timestamps by default
@@ -11,6 +11,7 @@ from zipbundler.utils.excludes import (
     resolve_excludes,
 )
 from zipbundler.utils.gitignore import (
+    iter_gitignore_patterns,
     load_gitignore_patterns,
     resolve_gitignore,
 )
@@ -23,6 +24,7 @@ from zipbundler.utils.includes import (
 
 __all__ = [
     "discover_installed_packages_roots",
+    "iter_gitignore_patterns",
     "load_gitignore_patterns",
     "make_exclude_resolved",
     "make_include_resolved",
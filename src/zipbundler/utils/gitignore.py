@@ -1,6 +1,7 @@
 """Utilities for gitignore handling and respect configuration."""
 
 import argparse
+from collections.abc import Iterator
 from pathlib import Path
 
 from apathetic_utils import cast_hint
@@ -9,6 +10,30 @@ from zipbundler.constants import DEFAULT_RESPECT_GITIGNORE
 from zipbundler.logs import getAppLogger
 
 
+def iter_gitignore_patterns(gitignore_path: Path) -> Iterator[str]:
+    """Yield patterns from .gitignore file as they are read.
+
+    Skips blank lines and lines starting with '#'. A missing file yields
+    nothing; other read errors are logged as a warning.
+
+    Args:
+        gitignore_path: Path to .gitignore file
+
+    Yields:
+        Gitignore pattern strings
+    """
+    try:
+        with gitignore_path.open(encoding="utf-8") as f:
+            for line in f:
+                clean_line = line.strip()
+                if clean_line and not clean_line.startswith("#"):
+                    yield clean_line
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        getAppLogger().warning("Failed to read .gitignore: %s", e)
+
+
 def load_gitignore_patterns(gitignore_path: Path) -> list[str]:
     """Load patterns from .gitignore file.
 
@@ -21,20 +46,7 @@ def load_gitignore_patterns(gitignore_path: Path) -> list[str]:
     Returns:
         List of gitignore pattern strings
     """
-    logger = getAppLogger()
-    patterns: list[str] = []
-
-    if gitignore_path.exists():
-        try:
-            content = gitignore_path.read_text(encoding="utf-8")
-            for line in content.splitlines():
-                clean_line = line.strip()
-                if clean_line and not clean_line.startswith("#"):
-                    patterns.append(clean_line)
-        except OSError as e:
-            logger.warning("Failed to read .gitignore: %s", e)
-
-    return patterns
+    return list(iter_gitignore_patterns(gitignore_path))
 
 
 def resolve_gitignore(
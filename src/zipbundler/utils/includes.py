@@ -43,8 +43,31 @@ def make_include_resolved(
     return result_dict  # type: ignore[return-value]
 
 
+def _resolve_root(root: Path, root_cache: dict[Path, Path] | None) -> Path:
+    """Resolve an include root, reusing results from `root_cache`.
+
+    The same cwd or config directory is resolved once for every include
+    parsed against it within one call, instead of once per include.
+
+    Args:
+        root: Root directory
+        root_cache: Optional per-call cache of resolved roots
+
+    Returns:
+        The resolved root
+    """
+    if root_cache is None:
+        return root.resolve()
+    resolved = root_cache.get(root)
+    if resolved is None:
+        resolved = root_cache[root] = root.resolve()
+    return resolved
+
+
 def parse_include_with_dest(
-    raw: str, context_root: Path
+    raw: str,
+    context_root: Path,
+    root_cache: dict[Path, Path] | None = None,
 ) -> tuple[IncludeResolved, bool]:
     """Parse include string with optional :dest suffix.
 
@@ -55,36 +78,42 @@ def parse_include_with_dest(
     Args:
         raw: Raw include string, may contain ":dest" suffix
         context_root: Root directory for path resolution (cwd for CLI args)
+        root_cache: Optional cache shared by the includes of one
+            `resolve_includes` call, so each root is resolved once
 
     Returns:
         Tuple of (IncludeResolved, has_dest) where has_dest indicates
         if a destination was parsed from the input. The IncludeResolved
         has origin="cli".
     """
+    root = _resolve_root(context_root, root_cache)
+
+    # Fast path: most includes have no colon, so there is nothing to split
+    colon = raw.rfind(":")
+    if colon == -1:
+        full_path = (root / raw).resolve()
+        return make_include_resolved(full_path, root, "cli", pattern=raw), False
+
     has_dest = False
     path_str = raw
     dest_str: str | None = None
 
     # Handle "path:dest" format - split on last colon
-    if ":" in raw:
-        parts = raw.rsplit(":", 1)
-        path_part, dest_part = parts[0], parts[1]
-
-        # Check if this is a Windows drive letter (C:, D:, etc.)
-        # Drive letters are 1-2 chars, possibly with backslash
-        is_drive_letter = len(path_part) <= 2 and (  # noqa: PLR2004
-            len(path_part) == 1 or path_part.endswith("\\")
-        )
+    path_part, dest_part = raw[:colon], raw[colon + 1 :]
 
-        if not is_drive_letter:
-            # Valid dest separator found
-            path_str = path_part
-            dest_str = dest_part
-            has_dest = True
+    # Check if this is a Windows drive letter (C:, D:, etc.)
+    # Drive letters are a single letter, possibly followed by a backslash
+    drive, rest = path_part[:1], path_part[1:]
+    is_drive_letter = drive.isascii() and drive.isalpha() and rest in ("", "\\")
+
+    if not is_drive_letter:
+        # Valid dest separator found
+        path_str = path_part
+        dest_str = dest_part
+        has_dest = True
 
     # Normalize the path: resolve relative paths to absolute
-    full_path = (context_root / path_str).resolve()
-    root = context_root.resolve()
+    full_path = (root / path_str).resolve()
 
     # Create IncludeResolved with origin="cli" (from --include or --add-include)
     inc = make_include_resolved(
@@ -102,13 +131,16 @@ def parse_include_with_dest(
 
 
 def _resolve_config_includes(
-    include_list: list[object], config_dir: Path
+    include_list: list[object],
+    config_dir: Path,
+    root_cache: dict[Path, Path] | None = None,
 ) -> list[IncludeResolved]:
     """Resolve includes from config file (relative to config_dir).
 
     Args:
         include_list: Raw include list from config
         config_dir: Directory of config file
+        root_cache: Optional per-call cache of resolved roots
 
     Returns:
         List of resolved includes with origin="config"
@@ -149,7 +181,7 @@ def _resolve_config_includes(
             includes.append(inc)
         elif isinstance(raw, str):
             # String format: "path/to/files" or "path:dest"
-            inc, _ = parse_include_with_dest(raw, config_dir)
+            inc, _ = parse_include_with_dest(raw, config_dir, root_cache)
             # Override origin since this came from config, not CLI
             inc["origin"] = "config"
             includes.append(inc)
@@ -158,13 +190,16 @@ def _resolve_config_includes(
 
 
 def _resolve_cli_includes(
-    include_list: list[object], cwd: Path
+    include_list: list[object],
+    cwd: Path,
+    root_cache: dict[Path, Path] | None = None,
 ) -> list[IncludeResolved]:
     """Resolve includes from CLI arguments (relative to cwd).
 
     Args:
         include_list: Raw include list from CLI
         cwd: Current working directory
+        root_cache: Optional per-call cache of resolved roots
 
     Returns:
         List of resolved includes with origin="cli"
@@ -173,7 +208,7 @@ def _resolve_cli_includes(
 
     for raw in include_list:
         if isinstance(raw, str):
-            inc, _ = parse_include_with_dest(raw, cwd)
+            inc, _ = parse_include_with_dest(raw, cwd, root_cache)
             includes.append(inc)
 
     return includes
@@ -205,6 +240,9 @@ def resolve_includes(
     """
     logger = getAppLogger()
     includes: list[IncludeResolved] = []
+    # Roots resolved once per call; not kept across builds, so a retargeted
+    # symlinked root is picked up by the next build
+    root_cache: dict[Path, Path] = {}
 
     # Case 1: --include provided (full override)
     include_arg: object = getattr(args, "include", None)
@@ -214,7 +252,7 @@ def resolve_includes(
             "[resolve_includes] Using --include override (%d items)",
             len(cli_list),
         )
-        includes.extend(_resolve_cli_includes(cli_list, cwd))
+        includes.extend(_resolve_cli_includes(cli_list, cwd, root_cache))
 
     # Case 2: includes from config file
     elif raw_config and "include" in raw_config:
@@ -225,7 +263,7 @@ def resolve_includes(
                 "[resolve_includes] Using config includes (%d items)",
                 len(cfg_list),
             )
-            includes.extend(_resolve_config_includes(cfg_list, config_dir))
+            includes.extend(_resolve_config_includes(cfg_list, config_dir, root_cache))
 
     # Case 3: --add-zip (extend with zip type, not override)
     add_zip_arg: object = getattr(args, "add_zip", None)
@@ -238,7 +276,7 @@ def resolve_includes(
         # Create includes with type="zip", support PATH or PATH:dest syntax
         for raw in cli_list_zip:
             if isinstance(raw, str):
-                inc, _ = parse_include_with_dest(raw, cwd)
+                inc, _ = parse_include_with_dest(raw, cwd, root_cache)
                 inc["type"] = "zip"
                 includes.append(inc)
 
@@ -250,6 +288,6 @@ def resolve_includes(
             "[resolve_includes] Adding --add-include items (%d items)",
             len(cli_list_add),
         )
-        includes.extend(_resolve_cli_includes(cli_list_add, cwd))
+        includes.extend(_resolve_cli_includes(cli_list_add, cwd, root_cache))
 
     return includes
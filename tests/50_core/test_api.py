@@ -2,6 +2,7 @@
 """Tests for programmatic API functions."""
 
 import os
+import tempfile
 import zipfile
 from pathlib import Path
 
@@ -83,6 +84,27 @@ def test_create_archive_source_not_found(tmp_path: Path) -> None:
         zipbundler.create_archive(source=non_existent)
 
 
+def test_create_archive_invalid_main_with_archive_source(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test an invalid main fails before an archive source is extracted."""
+    pkg_dir = tmp_path / "mypackage"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
+    source = zipbundler.create_archive(source=pkg_dir, target=tmp_path / "src.pyz")
+
+    temp_root = tmp_path / "tmp"
+    temp_root.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(temp_root))
+
+    with pytest.raises(ValueError, match="Invalid entry point format"):
+        zipbundler.create_archive(
+            source=source, target=tmp_path / "out.pyz", main="a::b"
+        )
+
+    assert not any(temp_root.iterdir())
+
+
 def test_build_zip_with_packages(tmp_path: Path) -> None:
     """Test build_zip with packages parameter."""
     # Create a test package
@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 import zipbundler.build as mod_build
+import zipbundler.commands.build as mod_build_cmd
 
 
 def test_build_zipapp_with_entry_point(tmp_path: Path) -> None:
@@ -315,3 +316,34 @@ def test_build_zipapp_main_guard_multiline_entry_point(tmp_path: Path) -> None:
         assert "import sys" in main_content
         assert "from mypackage.module import main" in main_content
         assert "main()" in main_content
+
+
+def test_extract_entry_point_code_forms() -> None:
+    """Test entry point strings are turned into bootstrap code."""
+    assert (
+        mod_build_cmd.extract_entry_point_code("pkg.cli:main")
+        == "from pkg.cli import main\nmain()"
+    )
+    assert (
+        mod_build_cmd.extract_entry_point_code("pkg.cli:App.run")
+        == "from pkg.cli import App\nApp.run()"
+    )
+    module_code = mod_build_cmd.extract_entry_point_code("pkg")
+    assert module_code.startswith("import pkg\n")
+    assert "pkg.main()" in module_code
+
+
+def test_extract_entry_point_code_rejects_invalid() -> None:
+    """Test malformed entry points raise ValueError instead of bad code."""
+    for bad in (
+        "pkg:",
+        "pkg:main:extra",
+        "pkg;import os",
+        "my-pkg:main",
+        ".pkg",
+        "pkg.",
+        "pkg..mod",
+        "mod:.f",
+    ):
+        with pytest.raises(ValueError, match="Invalid entry point format"):
+            mod_build_cmd.extract_entry_point_code(bad)
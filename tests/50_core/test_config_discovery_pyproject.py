@@ -285,3 +285,25 @@ name = "broken"
         assert found_config.get("packages") == ["fallback/**/*.py"]
     finally:
         os.chdir(original_cwd)
+
+
+def test_find_config_sees_config_added_between_searches(tmp_path: Path) -> None:
+    """Test a config created after a search is found by the next search."""
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        """[tool.zipbundler]
+packages = ["src/**/*.py"]
+""",
+        encoding="utf-8",
+    )
+    result = zipbundler.find_config(None, tmp_path)
+    assert result is not None
+    assert result[0] == pyproject
+
+    # No mtime bump: discovery lists the directory fresh on every search
+    config_file = tmp_path / ".zipbundler.jsonc"
+    config_file.write_text('{"packages": ["lib"]}\n', encoding="utf-8")
+
+    result = zipbundler.find_config(None, tmp_path)
+    assert result is not None
+    assert result[0] == config_file
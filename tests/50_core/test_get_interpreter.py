@@ -101,4 +101,26 @@ def test_get_interpreter_with_entry_point(tmp_path: Path) -> None:
     assert interpreter == "/usr/bin/env python3"
 
 
+def test_get_archive_info_reads_interpreter_and_metadata(tmp_path: Path) -> None:
+    """Test interpreter and PKG-INFO metadata are read in one call."""
+    pkg_dir = tmp_path / "mypackage"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
+
+    output = tmp_path / "app.pyz"
+    mod_build.build_zipapp(
+        output=output,
+        packages=[pkg_dir],
+        shebang="#!/usr/bin/env python3",
+        metadata={"display_name": "My App", "version": "1.2.3"},
+    )
+
+    interpreter, metadata = mod_build.get_archive_info(output)
+    assert interpreter == "/usr/bin/env python3"
+    assert metadata is not None
+    assert metadata["display_name"] == "My App"
+    assert metadata["version"] == "1.2.3"
+    assert mod_build.get_metadata_from_archive(output) == metadata
+
+
 # CLI tests removed - old zipapp-style CLI no longer exists
@@ -0,0 +1,57 @@
+# tests/50_core/test_load_config_reload.py
+"""Tests that load_config() always reflects the config file on disk."""
+
+import os
+from pathlib import Path
+
+import zipbundler
+import zipbundler.config.config_loader as mod_config_loader
+
+
+def test_load_config_returns_independent_copies(tmp_path: Path) -> None:
+    """Test mutating a loaded config does not leak into later loads."""
+    config_file = tmp_path / ".zipbundler.jsonc"
+    config_file.write_text('{"packages": ["src/pkg"]}\n', encoding="utf-8")
+
+    first = mod_config_loader.load_config(config_file)
+    assert first is not None
+    first["packages"].append("other")
+
+    second = mod_config_loader.load_config(config_file)
+    assert second == {"packages": ["src/pkg"]}
+
+
+def test_load_config_reloads_changed_file(tmp_path: Path) -> None:
+    """Test a rewritten config file is parsed again."""
+    config_file = tmp_path / ".zipbundler.jsonc"
+    config_file.write_text('{"packages": ["a"]}\n', encoding="utf-8")
+    assert mod_config_loader.load_config(config_file) == {"packages": ["a"]}
+
+    config_file.write_text('{"packages": ["b", "c"]}\n', encoding="utf-8")
+
+    assert mod_config_loader.load_config(config_file) == {"packages": ["b", "c"]}
+
+
+def test_build_zip_sees_same_stamp_config_rewrite(tmp_path: Path) -> None:
+    """Test an API build re-reads a config rewritten within one mtime tick."""
+    pkg_dir = tmp_path / "src" / "pkg"
+    pkg_dir.mkdir(parents=True)
+    (pkg_dir / "__init__.py").write_text("")
+    config_file = tmp_path / ".zipbundler.json"
+    config_file.write_text(
+        '{"packages": ["src/pkg"], "output": {"path": "dist/aaa.pyz"}}\n',
+        encoding="utf-8",
+    )
+    st = config_file.stat()
+    mod_config_loader.load_config(config_file)
+
+    # Same size, same mtime: only a real re-read notices the change
+    config_file.write_text(
+        '{"packages": ["src/pkg"], "output": {"path": "dist/bbb.pyz"}}\n',
+        encoding="utf-8",
+    )
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    result = zipbundler.build_zip(config_path=config_file, cwd=tmp_path)
+
+    assert result.output_path == tmp_path / "dist" / "bbb.pyz"
@@ -153,3 +153,15 @@ node_modules/
     assert "*.pyc" in patterns
     assert "test_*.py" in patterns
     assert "node_modules/" in patterns
+
+
+def test_iter_gitignore_patterns_is_lazy(tmp_path: Path) -> None:
+    """Test iter_gitignore_patterns yields the same patterns lazily."""
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("# comment\n*.pyc\n\n__pycache__/\n")
+
+    patterns = mod_utils.iter_gitignore_patterns(gitignore)
+
+    assert not isinstance(patterns, list)
+    assert list(patterns) == ["*.pyc", "__pycache__/"]
+    assert list(mod_utils.iter_gitignore_patterns(tmp_path / "missing")) == []
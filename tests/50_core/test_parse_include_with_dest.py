@@ -0,0 +1,65 @@
+# tests/50_core/test_parse_include_with_dest.py
+"""Tests for parsing CLI include strings with an optional :dest suffix."""
+
+from pathlib import Path
+
+import pytest
+
+import zipbundler.utils as mod_utils
+
+
+def test_parse_include_without_colon(tmp_path: Path) -> None:
+    """Test a plain path is resolved against the context root."""
+    inc, has_dest = mod_utils.parse_include_with_dest("src/pkg", tmp_path)
+
+    assert not has_dest
+    assert inc["path"] == tmp_path.resolve() / "src" / "pkg"
+    assert inc["root"] == tmp_path.resolve()
+    assert "dest" not in inc
+
+
+def test_parse_include_with_dest(tmp_path: Path) -> None:
+    """Test a path:dest string is split on the last colon."""
+    inc, has_dest = mod_utils.parse_include_with_dest("src/pkg:vendor", tmp_path)
+
+    assert has_dest
+    assert inc["path"] == tmp_path.resolve() / "src" / "pkg"
+    assert inc.get("dest") == Path("vendor")
+
+
+@pytest.mark.parametrize(
+    ("raw", "expect_dest"),
+    [
+        ("C:", False),
+        ("c:\\", False),
+        ("1:out", True),
+        ("!\\:out", True),
+    ],
+)
+def test_parse_include_drive_letter(
+    tmp_path: Path, raw: str, *, expect_dest: bool
+) -> None:
+    """Test only an ASCII letter before the colon is taken as a drive."""
+    _inc, has_dest = mod_utils.parse_include_with_dest(raw, tmp_path)
+
+    assert has_dest is expect_dest
+
+
+def test_parse_include_follows_retargeted_root_symlink(tmp_path: Path) -> None:
+    """Test a symlinked root is resolved again on every call."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    link = tmp_path / "root"
+    link.symlink_to(first, target_is_directory=True)
+
+    inc, _ = mod_utils.parse_include_with_dest("pkg", link)
+    assert inc["root"] == first.resolve()
+
+    link.unlink()
+    link.symlink_to(second, target_is_directory=True)
+
+    inc, _ = mod_utils.parse_include_with_dest("pkg", link)
+    assert inc["root"] == second.resolve()
+    assert inc["path"] == second.resolve() / "pkg"
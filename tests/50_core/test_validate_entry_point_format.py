@@ -0,0 +1,45 @@
+# tests/50_core/test_validate_entry_point_format.py
+"""Tests for entry point format validation in config files."""
+
+import pytest
+
+import zipbundler.config.config_validate as mod_config_validate
+
+
+@pytest.mark.parametrize(
+    "entry_point",
+    ["pkg", "pkg.module", "pkg.module:main", "_private.mod:_run", "pkg:App.run"],
+)
+def test_validate_entry_point_format_accepts(entry_point: str) -> None:
+    """Test well-formed entry points are accepted."""
+    is_valid, msg = mod_config_validate._validate_entry_point_format(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        entry_point
+    )
+
+    assert is_valid
+    assert msg == ""
+
+
+@pytest.mark.parametrize(
+    "entry_point",
+    [
+        "",
+        "pkg.",
+        ".pkg",
+        "pkg..mod",
+        "pkg:",
+        "pkg:.f",
+        "pkg:a:b",
+        "1pkg",
+        "pkg-name",
+        "pkg:main\n",
+    ],
+)
+def test_validate_entry_point_format_rejects(entry_point: str) -> None:
+    """Test malformed entry points are rejected with a format message."""
+    is_valid, msg = mod_config_validate._validate_entry_point_format(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        entry_point
+    )
+
+    assert not is_valid
+    assert "Invalid entry point format" in msg
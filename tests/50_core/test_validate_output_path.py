@@ -0,0 +1,38 @@
+# tests/50_core/test_validate_output_path.py
+"""Tests for output path accessibility validation."""
+
+from pathlib import Path
+
+import zipbundler.config.config_validate as mod_config_validate
+
+
+def test_validate_output_path_does_not_create_directories(tmp_path: Path) -> None:
+    """Test a missing output directory is accepted without being created."""
+    is_valid, msg = mod_config_validate._validate_output_path_accessibility(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        "dist/nested/bundle.pyz", tmp_path
+    )
+
+    assert is_valid
+    assert msg == ""
+    assert not (tmp_path / "dist").exists()
+
+
+def test_validate_output_path_rejects_file_ancestor(tmp_path: Path) -> None:
+    """Test an output directory below a regular file is rejected."""
+    (tmp_path / "dist").write_text("not a directory")
+
+    is_valid, msg = mod_config_validate._validate_output_path_accessibility(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        "dist/nested/bundle.pyz", tmp_path
+    )
+
+    assert not is_valid
+    assert "is not a directory" in msg
+
+
+def test_nearest_existing_walks_up_to_existing_ancestor(tmp_path: Path) -> None:
+    """Test the nearest existing ancestor of a missing path is found."""
+    nearest = mod_config_validate._nearest_existing(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        tmp_path / "a" / "b" / "c"
+    )
+
+    assert nearest == tmp_path
@@ -1,10 +1,15 @@
 # tests/50_core/test_build_dependency_resolution.py
 """Tests for dependency resolution in build command."""
 
+import contextlib
 import os
+import sys
 import zipfile
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
+
 import zipbundler.cli as mod_main
 import zipbundler.commands.build as mod_build
 
@@ -28,6 +33,67 @@ def test_resolve_installed_package_nonexistent() -> None:
     assert result is None
 
 
+def test_build_dist_index_is_cached() -> None:
+    """Test the installed distribution index is built once and reused."""
+    index = mod_build._build_dist_index()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert "apathetic_utils" in index
+    assert mod_build._build_dist_index() is index  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+def test_find_distribution_direct_lookup() -> None:
+    """Test distributions are found by name in either normalization."""
+    by_dash = mod_build._find_distribution("apathetic-utils")  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    by_underscore = mod_build._find_distribution("apathetic_utils")  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert by_dash is not None
+    assert by_dash == by_underscore
+    assert mod_build._find_distribution("nonexistent_package_xyz_123") is None  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+def test_resolve_packages_dedupes_repeated_patterns(tmp_path: Path) -> None:
+    """Test repeated patterns resolve once and installed lookups are cached."""
+    pkg_dir = tmp_path / "mypkg"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
+
+    resolved = mod_build._resolve_packages(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        ["mypkg", "apathetic_utils", "mypkg", "apathetic_utils"], tmp_path
+    )
+    assert len(resolved) == 2  # noqa: PLR2004
+    assert resolved[0] == pkg_dir
+
+    info = mod_build._locate_installed_package.cache_info()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    mod_build._resolve_installed_package("apathetic_utils")  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert mod_build._locate_installed_package.cache_info().hits == info.hits + 1  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+def test_invalidate_package_cache_clears_lookups() -> None:
+    """Test invalidate_package_cache drops memoized installed-package lookups."""
+    assert mod_build._resolve_installed_package("apathetic_utils") is not None  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert mod_build._cached_find_spec.cache_info().currsize > 0  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    mod_build.invalidate_package_cache()
+
+    assert mod_build._cached_find_spec.cache_info().currsize == 0  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert mod_build._locate_installed_package.cache_info().currsize == 0  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert mod_build._resolve_installed_package("apathetic_utils") is not None  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+def test_resolve_installed_subpackage_does_not_import_parent(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test dotted package names are located without executing the parent."""
+    parent = tmp_path / "zb_noimport_parent"
+    (parent / "sub").mkdir(parents=True)
+    (parent / "__init__.py").write_text("raise RuntimeError('imported')\n")
+    (parent / "sub" / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    mod_build.invalidate_package_cache()
+
+    result = mod_build._resolve_installed_package("zb_noimport_parent.sub")  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert result == parent / "sub"
+    assert "zb_noimport_parent" not in sys.modules
+
+
 def test_resolve_package_pattern_with_installed_package(tmp_path: Path) -> None:
     """Test resolving a package pattern that includes an installed package."""
     original_cwd = Path.cwd()
@@ -140,3 +206,249 @@ def test_resolve_package_pattern_relative_path_not_package(tmp_path: Path) -> No
         assert len(resolved) == 0
     finally:
         os.chdir(original_cwd)
+
+
+def test_resolve_package_pattern_glob_collects_parent_dirs(tmp_path: Path) -> None:
+    """Test glob patterns resolve to the unique parents of matched .py files."""
+    for name in ("pkg_a", "pkg_b"):
+        pkg = tmp_path / name
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        (pkg / "mod.py").write_text("")
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "notes" / "readme.txt").write_text("")
+
+    resolved = mod_build._resolve_package_pattern("*/*.py", tmp_path)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert sorted(resolved) == [
+        (tmp_path / "pkg_a").resolve(),
+        (tmp_path / "pkg_b").resolve(),
+    ]
+
+
+def test_resolve_packages_keeps_pattern_order(tmp_path: Path) -> None:
+    """Test many patterns resolve one after another in config order."""
+    names = ["pkg_d", "pkg_a", "pkg_c", "pkg_b"]
+    for name in names:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "__init__.py").write_text("")
+
+    resolved = mod_build._resolve_packages(names, tmp_path)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert resolved == [tmp_path / name for name in names]
+
+
+def test_resolve_package_pattern_glob_with_literal_prefix(tmp_path: Path) -> None:
+    """Test globs with a directory prefix match relative to cwd."""
+    for name in ("pkg_one", "pkg_two", "other"):
+        (tmp_path / "src" / name).mkdir(parents=True)
+
+    resolved = mod_build._resolve_package_pattern("src/pkg_*", tmp_path)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert sorted(resolved) == [
+        tmp_path / "src" / "pkg_one",
+        tmp_path / "src" / "pkg_two",
+    ]
+
+
+def test_resolve_packages_dedupes_symlink_aliases(tmp_path: Path) -> None:
+    """Test a package reached through a symlink is resolved only once."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg").symlink_to(tmp_path / "src" / "pkg", target_is_directory=True)
+
+    resolved = mod_build._resolve_packages(["src/pkg", "pkg"], tmp_path)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    assert resolved == [(tmp_path / "src" / "pkg").resolve()]
+
+
+@pytest.mark.filterwarnings("error:Duplicate name")
+def test_build_symlink_alias_archives_package_once(tmp_path: Path) -> None:
+    """Test a package listed directly and via a symlink is archived once."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg").symlink_to(tmp_path / "src" / "pkg", target_is_directory=True)
+    (tmp_path / ".zipbundler.jsonc").write_text(
+        '{"packages": ["src/pkg", "pkg"], "output": {"path": "dist/app.pyz"}}\n',
+        encoding="utf-8",
+    )
+
+    original_cwd = Path.cwd()
+    try:
+        os.chdir(tmp_path)
+        main_func = mod_main if callable(mod_main) else mod_main.main
+        code = main_func(["--build"])
+    finally:
+        os.chdir(original_cwd)
+
+    assert code == 0
+    with zipfile.ZipFile(tmp_path / "dist" / "app.pyz") as zf:
+        assert zf.namelist().count("pkg/__init__.py") == 1
+
+
+def test_resolve_package_pattern_glob_dedupes_symlinked_dirs(tmp_path: Path) -> None:
+    """Test a glob reaching one package through a symlink yields it once."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "link").symlink_to(tmp_path / "src", target_is_directory=True)
+
+    resolved = mod_build._resolve_package_pattern("*/pkg", tmp_path)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    assert resolved == [(tmp_path / "src" / "pkg").resolve()]
+
+
+@pytest.mark.filterwarnings("error:Duplicate name")
+def test_build_symlinked_include_matches_package(tmp_path: Path) -> None:
+    """Test an include globbing a package via a symlink does not re-add it."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "link").symlink_to(tmp_path / "src", target_is_directory=True)
+    (tmp_path / ".zipbundler.jsonc").write_text(
+        '{"packages": ["src/pkg"], "include": ["lin*/pkg"],'
+        ' "output": {"path": "dist/app.pyz"}}\n',
+        encoding="utf-8",
+    )
+
+    original_cwd = Path.cwd()
+    try:
+        os.chdir(tmp_path)
+        main_func = mod_main if callable(mod_main) else mod_main.main
+        code = main_func(["--build"])
+    finally:
+        os.chdir(original_cwd)
+
+    assert code == 0
+    with zipfile.ZipFile(tmp_path / "dist" / "app.pyz") as zf:
+        assert zf.namelist().count("pkg/__init__.py") == 1
+
+
+def test_scandir_glob_matches_segments(tmp_path: Path) -> None:
+    """Test the scandir walker's "*", "**" and hidden-name handling."""
+    for rel in ("a/b/c.py", "a/x.txt", "a/.hidden/d.py", "e/f/g.py"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("")
+
+    def run(pattern: str) -> list[tuple[str, bool]]:
+        return [
+            (os.path.relpath(p, tmp_path), is_dir)
+            for p, is_dir in mod_build._scandir_glob(str(tmp_path), pattern)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        ]
+
+    assert run("*/*") == [
+        ("a/b", True),
+        ("a/x.txt", False),
+        ("e/f", True),
+    ]
+    assert run("**/*.py") == [("a/b/c.py", False), ("e/f/g.py", False)]
+    assert run("a/.*/*.py") == [("a/.hidden/d.py", False)]
+    assert run("e/f/missing.py") == []
+
+
+def test_scandir_glob_follows_symlinked_dirs_without_looping(tmp_path: Path) -> None:
+    """Test "**" descends into symlinked directories and stops at loops."""
+    (tmp_path / "real" / "pkg").mkdir(parents=True)
+    (tmp_path / "real" / "pkg" / "mod.py").write_text("")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "linked").symlink_to(
+        tmp_path / "real", target_is_directory=True
+    )
+    (tmp_path / "real" / "pkg" / "loop").symlink_to(
+        tmp_path / "real", target_is_directory=True
+    )
+
+    matches = [
+        os.path.relpath(p, tmp_path)
+        for p, _is_dir in mod_build._scandir_glob(str(tmp_path), "src/**/*.py")  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    ]
+
+    assert matches == ["src/linked/pkg/mod.py"]
+
+
+def test_resolve_package_pattern_uses_stat_cache(tmp_path: Path) -> None:
+    """Test path kinds are recorded in and served from the shared stat cache."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    stat_cache: dict[str, mod_build.StatKind] = {}
+
+    resolved = mod_build._resolve_package_pattern(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        "src/pkg", tmp_path, stat_cache=stat_cache
+    )
+    assert resolved == [tmp_path / "src" / "pkg"]
+    assert stat_cache[str(tmp_path / "src" / "pkg")] == "dir"
+
+    # A cached answer wins over the filesystem for the rest of the build
+    stat_cache[str(tmp_path / "src" / "pkg")] = "missing"
+    assert (
+        mod_build._resolve_package_pattern(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+            "src/pkg", tmp_path, stat_cache=stat_cache
+        )
+        == []
+    )
+
+
+def test_classify_pattern_kinds() -> None:
+    """Test package patterns are classified with their literal base."""
+    classify = mod_build._classify_pattern  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert classify("src/**/*.py") == ("py_recursive", "src")
+    assert classify("src/pkg_*") == ("glob", "src")
+    assert classify("*/mod.py") == ("glob", "")
+    assert classify("/abs/*") == ("glob", "/abs")
+    assert classify("/*") == ("glob", "/")
+    assert classify("src/pkg") == ("path", "src/pkg")
+    assert classify("./pkg") == ("path", "./pkg")
+    assert classify("apathetic_utils") == ("name", "apathetic_utils")
+
+
+def test_prime_stat_cache_classifies_siblings(tmp_path: Path) -> None:
+    """Test sibling include paths are classified from one listing."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "data.txt").write_text("")
+    (tmp_path / "lone").mkdir()
+    (tmp_path / "lone" / "only").mkdir()
+    stat_cache: dict[str, mod_build.StatKind] = {}
+
+    mod_build._prime_stat_cache(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        [
+            str(tmp_path / "pkg"),
+            str(tmp_path / "data.txt"),
+            str(tmp_path / "gone"),
+            str(tmp_path / "lone" / "only"),
+        ],
+        stat_cache,
+    )
+    assert stat_cache == {
+        str(tmp_path / "pkg"): "dir",
+        str(tmp_path / "data.txt"): "file",
+    }
+
+
+def test_prime_stat_cache_stops_early_in_large_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a few paths in a large directory don't read its whole listing."""
+    for i in range(100):
+        (tmp_path / f"other_{i:03d}").write_text("")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "data.txt").write_text("")
+    read: list[str] = []
+    real_scandir = os.scandir
+
+    def iter_entries(path: str) -> Iterator[os.DirEntry[str]]:
+        with real_scandir(path) as it:
+            for entry in it:
+                read.append(entry.name)
+                yield entry
+
+    def counting_scandir(
+        path: str,
+    ) -> contextlib.closing[Iterator[os.DirEntry[str]]]:
+        return contextlib.closing(iter_entries(path))
+
+    monkeypatch.setattr(mod_build.os, "scandir", counting_scandir)
+    stat_cache: dict[str, mod_build.StatKind] = {}
+
+    mod_build._prime_stat_cache(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        [str(tmp_path / "pkg"), str(tmp_path / "data.txt")], stat_cache
+    )
+
+    budget = 2 * mod_build._PRIME_ENTRIES_PER_NAME  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert len(read) <= budget
+    # Anything not reached is left for _stat_kind, which still classifies it
+    assert mod_build._stat_kind(str(tmp_path / "pkg"), stat_cache) == "dir"  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert mod_build._stat_kind(str(tmp_path / "data.txt"), stat_cache) == "file"  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
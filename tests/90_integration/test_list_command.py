@@ -7,6 +7,7 @@ import pytest
 
 import zipbundler.build as mod_build
 import zipbundler.cli as mod_main
+import zipbundler.commands.list as mod_list
 
 
 EXPECTED_FILE_COUNT_BASIC = 2
@@ -426,3 +427,47 @@ def test_cli_list_command_archive_tree(
     output = captured.out
     # Tree should have tree characters
     assert "├──" in output or "└──" in output
+
+
+def test_render_tree() -> None:
+    """Test the list tree is rendered from arcnames, sorted by name."""
+    files = [
+        (Path("src/pkg/b.py"), Path("pkg/b.py")),
+        (Path("src/pkg/sub/c.py"), Path("pkg/sub/c.py")),
+        (Path("src/pkg/a.py"), Path("pkg/a.py")),
+    ]
+
+    lines: list[str] = []
+    mod_list._render_tree(files, lines)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    assert lines == [
+        "└── pkg",
+        "    ├── a.py",
+        "    ├── b.py",
+        "    └── sub",
+        "        └── c.py",
+    ]
+
+
+def test_render_tree_continues_branch_after_nested_directory() -> None:
+    """Test siblings after a nested directory keep the parent's branch line."""
+    files = [
+        (Path("src/top.py"), Path("top.py")),
+        (Path("src/pkg/sub/deep/d.py"), Path("pkg/sub/deep/d.py")),
+        (Path("src/pkg/z.py"), Path("pkg/z.py")),
+        (Path("src/pkg/sub/c.py"), Path("pkg/sub/c.py")),
+        (Path("other/pkg/z.py"), Path("pkg/z.py")),
+    ]
+
+    lines: list[str] = []
+    mod_list._render_tree(files, lines)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    assert lines == [
+        "├── pkg",
+        "│   ├── sub",
+        "│   │   ├── c.py",
+        "│   │   └── deep",
+        "│   │       └── d.py",
+        "│   └── z.py",
+        "└── top.py",
+    ]
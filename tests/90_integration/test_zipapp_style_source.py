@@ -2,6 +2,7 @@
 """Tests for zipapp-style SOURCE building, including reading .pyz archives."""
 
 import shutil
+import tempfile
 import zipfile
 from pathlib import Path
 
@@ -9,6 +10,7 @@ import pytest
 
 import zipbundler.build as mod_build
 import zipbundler.cli as mod_main
+import zipbundler.commands.zipapp_style as mod_zipapp_style
 
 
 def test_zipapp_style_from_directory(tmp_path: Path) -> None:
@@ -83,6 +85,35 @@ def test_zipapp_style_from_archive(tmp_path: Path) -> None:
     assert interpreter is None
 
 
+def test_zipapp_style_from_archive_invalid_main(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test an invalid --main fails without leaving an extracted archive behind."""
+    pkg_dir = tmp_path / "mypackage"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
+
+    initial_archive = tmp_path / "initial.pyz"
+    mod_build.build_zipapp(
+        output=initial_archive,
+        packages=[pkg_dir],
+        entry_point=None,
+        shebang="#!/usr/bin/env python3",
+    )
+
+    temp_root = tmp_path / "tmp"
+    temp_root.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(temp_root))
+
+    output = tmp_path / "new.pyz"
+    main_func = mod_main if callable(mod_main) else mod_main.main
+    code = main_func([str(initial_archive), "-o", str(output), "-m", "a::b"])
+
+    assert code == 1
+    assert not output.exists()
+    assert not any(temp_root.iterdir())
+
+
 def test_zipapp_style_from_archive_with_options(tmp_path: Path) -> None:
     """Test zipapp-style CLI building from archive with shebang and entry point."""
     # Create initial archive
@@ -346,3 +377,28 @@ def test_extract_archive_to_tempdir(tmp_path: Path) -> None:
     finally:
         # Clean up
         shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_is_archive_file_sniffs_zip_behind_shebang(tmp_path: Path) -> None:
+    """Test shebang archives without a .pyz suffix are detected from their header."""
+    plain_zip = tmp_path / "bundle.bin"
+    with zipfile.ZipFile(plain_zip, "w") as zf:
+        zf.writestr("__main__.py", "print('hi')\n")
+    with_shebang = tmp_path / "app"
+    with_shebang.write_bytes(b"#!/usr/bin/env python3\n" + plain_zip.read_bytes())
+    script = tmp_path / "script"
+    script.write_text("#!/usr/bin/env python3\nprint('hi')\n")
+
+    assert mod_zipapp_style.is_archive_file(with_shebang)
+    assert not mod_zipapp_style.is_archive_file(script)
+    assert not mod_zipapp_style.is_archive_file(tmp_path)
+
+
+def test_is_archive_file_ignores_bare_zip_data(tmp_path: Path) -> None:
+    """Test zip files without a shebang (e.g. .zip, .whl) are not zipapps."""
+    for name in ("bundle.bin", "bundle.zip", "pkg-1.0-py3-none-any.whl"):
+        archive = tmp_path / name
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("__main__.py", "print('hi')\n")
+
+        assert not mod_zipapp_style.is_archive_file(archive)